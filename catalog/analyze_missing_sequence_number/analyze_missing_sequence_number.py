@@ -11,13 +11,14 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from catalog.common.basic_metrics import iter_basic_metrics_rows
+from catalog.common.basic_metrics import iter_basic_metrics_frames
 
 DATA_DIR = Path("data")
 OUTPUT_SUMMARY_CSV = "missing_per_day.csv"
@@ -27,28 +28,37 @@ def main() -> None:
     previous_sequence: int | None = None
     skipped_sequence = 0
     parsed_rows = 0
-    missing_by_day: defaultdict[object, int] = defaultdict(int)
-
-    for timestamp, _, sequence in iter_basic_metrics_rows(DATA_DIR):
-        parsed_rows += 1
-        if sequence is None:
-            skipped_sequence += 1
+    missing_by_day: defaultdict[str, int] = defaultdict(int)
+
+    # Chunks arrive in file order; the last sequence of each chunk is carried
+    # into the next so gaps spanning a chunk boundary are still counted.
+    for chunk in iter_basic_metrics_frames(DATA_DIR, columns=["sequence"]):
+        parsed_rows += len(chunk)
+        sequenced = chunk.dropna(subset=["sequence"])
+        skipped_sequence += len(chunk) - len(sequenced)
+        if sequenced.empty:
             continue
 
-        if previous_sequence is not None:
-            gap = sequence - previous_sequence
-            if gap > 1:
-                missing_by_day[timestamp.date()] += gap - 1
-        previous_sequence = sequence
+        sequences = sequenced["sequence"].to_numpy(dtype=np.int64)
+        first = sequences[0] if previous_sequence is None else previous_sequence
+        missing_count = (np.diff(sequences, prepend=first) - 1).clip(min=0)
+        previous_sequence = int(sequences[-1])
+
+        # Sum per day with integer day codes and one bincount pass rather than
+        # a pandas groupby over an intermediate Series.
+        day_codes, days = pd.factorize(sequenced["date"])
+        missing_per_code = np.bincount(day_codes, weights=missing_count, minlength=len(days))
+        for day, count in zip(days, missing_per_code):
+            if count > 0:
+                missing_by_day[day] += int(count)
 
     if not missing_by_day and parsed_rows == skipped_sequence:
         raise SystemExit("No valid records with timestamp+sequence found in data folder.")
 
-    missing_rows = [
-        {"date": day, "missing_count": int(count)}
-        for day, count in sorted(missing_by_day.items())
-    ]
-    missing_per_day = pd.DataFrame(missing_rows or [{"date": None, "missing_count": 0}]).dropna()
+    missing_per_day = pd.DataFrame(
+        [{"date": day, "missing_count": count} for day, count in sorted(missing_by_day.items())],
+        columns=["date", "missing_count"],
+    )
 
     print(f"Parsed {parsed_rows} rows; skipped {skipped_sequence} rows missing sequence.")
     print("\nMissing sequence numbers per day:")
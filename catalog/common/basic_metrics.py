@@ -3,19 +3,26 @@
 The automatic runtime builds this once per session so several health scripts can
 read timestamp/machine/sequence rows without repeatedly parsing full JSONL
 payloads. It is a performance artifact, not a replacement for raw telemetry.
+
+The dataset is stored as Parquet so readers can load only the columns they
+need, with integer sequences already typed.
 """
 
 from __future__ import annotations
 
-import csv
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterable, Iterator
+
+import pandas as pd
 
 from catalog.common.data_loading import iter_records_with_parsed_timestamps
 
 DERIVED_DIRNAME = "_derived"
-BASIC_METRICS_FILENAME = "basic_metrics.csv"
+BASIC_METRICS_FILENAME = "basic_metrics.parquet"
+BASIC_METRICS_COLUMNS: tuple[str, ...] = ("timestamp", "machine", "sequence")
+_WRITE_BATCH_ROWS = 250_000
+DEFAULT_READ_BATCH_ROWS = 250_000
 
 
 def basic_metrics_path(filtered_data_dir: Path) -> Path:
@@ -23,20 +30,41 @@ def basic_metrics_path(filtered_data_dir: Path) -> Path:
     return filtered_data_dir / DERIVED_DIRNAME / BASIC_METRICS_FILENAME
 
 
+def _sequence_value(value: Any) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return None
+
+
 def build_basic_metrics_dataset(filtered_data_dir: Path) -> tuple[Path, int]:
-    """Create the compact CSV consumed by startup-safe analyses.
+    """Create the compact Parquet file consumed by startup-safe analyses.
 
-    The CSV intentionally contains only ``timestamp``, ``machine``, and
-    ``sequence``. Analyses requiring richer fields should read the session JSONL
-    data directly rather than expanding this bootstrap artifact.
+    The file intentionally contains only ``timestamp`` (ISO text as parsed),
+    ``machine``, and integer ``sequence``. Analyses requiring richer fields
+    should read the session JSONL data directly rather than expanding this
+    bootstrap artifact.
     """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
     output_path = basic_metrics_path(filtered_data_dir)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    schema = pa.schema(
+        [("timestamp", pa.string()), ("machine", pa.string()), ("sequence", pa.int64())]
+    )
 
     written_rows = 0
-    with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(["timestamp", "machine", "sequence"])
+    columns: dict[str, list[Any]] = {name: [] for name in BASIC_METRICS_COLUMNS}
+    with pq.ParquetWriter(output_path, schema, compression="zstd") as writer:
+
+        def flush() -> None:
+            if columns["timestamp"]:
+                writer.write_table(pa.table(columns, schema=schema))
+                for values in columns.values():
+                    values.clear()
 
         for _, record in iter_records_with_parsed_timestamps(
             filtered_data_dir,
@@ -47,34 +75,87 @@ def build_basic_metrics_dataset(filtered_data_dir: Path) -> tuple[Path, int]:
             if timestamp is None:
                 continue
             machine = record.get("machine")
-            sequence = record.get("sequence")
-            writer.writerow([
-                timestamp.isoformat(),
-                "" if machine is None else str(machine),
-                "" if sequence is None else str(sequence),
-            ])
+            columns["timestamp"].append(timestamp.isoformat())
+            columns["machine"].append(None if machine is None else str(machine))
+            columns["sequence"].append(_sequence_value(record.get("sequence")))
             written_rows += 1
+            if len(columns["timestamp"]) >= _WRITE_BATCH_ROWS:
+                flush()
+        flush()
 
     return output_path, written_rows
 
 
 def iter_basic_metrics_rows(filtered_data_dir: Path) -> Iterator[tuple[datetime, str | None, int | None]]:
-    """Iterate compact metric rows from the derived CSV."""
-    source = basic_metrics_path(filtered_data_dir)
-    with source.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            raw_timestamp = (row.get("timestamp") or "").strip()
+    """Iterate compact metric rows from the derived Parquet file."""
+    import pyarrow.parquet as pq
+
+    source = pq.ParquetFile(basic_metrics_path(filtered_data_dir))
+    for batch in source.iter_batches(columns=list(BASIC_METRICS_COLUMNS)):
+        rows = zip(*(batch.column(name).to_pylist() for name in BASIC_METRICS_COLUMNS))
+        for raw_timestamp, machine, sequence in rows:
+            raw_timestamp = (raw_timestamp or "").strip()
             if not raw_timestamp:
                 continue
             try:
                 timestamp = datetime.fromisoformat(raw_timestamp)
             except ValueError:
                 continue
-            machine = (row.get("machine") or "").strip() or None
-            raw_sequence = (row.get("sequence") or "").strip()
-            try:
-                sequence = int(raw_sequence) if raw_sequence else None
-            except ValueError:
-                sequence = None
-            yield timestamp, machine, sequence
+            yield timestamp, (machine or "").strip() or None, sequence
+
+
+def _metrics_columns(columns: Iterable[str]) -> list[str]:
+    return ["timestamp", *(name for name in columns if name != "timestamp")]
+
+
+def _normalize_metrics_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    raw_timestamp = frame["timestamp"].astype("string").str.strip()
+    timestamp = pd.to_datetime(raw_timestamp, format="ISO8601", utc=True, errors="coerce")
+    valid = timestamp.notna().to_numpy()
+
+    result = pd.DataFrame(
+        {
+            "timestamp": timestamp[valid],
+            "date": raw_timestamp[valid].str.slice(0, 10),
+        }
+    )
+    if "machine" in frame.columns:
+        machine = frame["machine"].astype("string").str.strip()[valid]
+        result["machine"] = machine.mask(machine == "")
+    if "sequence" in frame.columns:
+        result["sequence"] = frame["sequence"].astype("Int64")[valid]
+    return result.reset_index(drop=True)
+
+
+def read_basic_metrics_frame(
+    filtered_data_dir: Path,
+    columns: Iterable[str] = BASIC_METRICS_COLUMNS,
+) -> pd.DataFrame:
+    """Load the derived metrics as a dataframe for vectorized analyses.
+
+    Only ``columns`` are read from disk; ``timestamp`` is always included.
+    Rows are filtered like :func:`iter_basic_metrics_rows`: blank or invalid
+    timestamps are dropped and blank machines become missing. ``date`` holds
+    the calendar day exactly as written in the timestamp, without timezone
+    conversion.
+    """
+    frame = pd.read_parquet(basic_metrics_path(filtered_data_dir), columns=_metrics_columns(columns))
+    return _normalize_metrics_frame(frame)
+
+
+def iter_basic_metrics_frames(
+    filtered_data_dir: Path,
+    columns: Iterable[str] = BASIC_METRICS_COLUMNS,
+    *,
+    batch_rows: int = DEFAULT_READ_BATCH_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """Yield the derived metrics in bounded chunks, in file order.
+
+    Each chunk is normalized like :func:`read_basic_metrics_frame`, so callers
+    can accumulate aggregates without holding the whole dataset in memory.
+    """
+    import pyarrow.parquet as pq
+
+    source = pq.ParquetFile(basic_metrics_path(filtered_data_dir))
+    for batch in source.iter_batches(batch_size=batch_rows, columns=_metrics_columns(columns)):
+        yield _normalize_metrics_frame(batch.to_pandas())
@@ -7,21 +7,29 @@ reusing repeated dataframe logic.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from catalog.common.telemetry_prep import to_numeric
 
 
 def prepare_stop_numeric_columns(df: pd.DataFrame, numeric_cols: list[str]) -> tuple[pd.DataFrame, list[str]]:
-    """Coerce available stop-related numeric columns to numeric dtype.
-
-    Returns a copied dataframe and the subset of ``numeric_cols`` present in the
-    dataframe.
+    """Coerce available stop-related numeric columns to ``float32``.
+
+    Stop detection only compares these signals with zero, so single precision
+    is sufficient and halves the bytes scanned. Columns that are already
+    ``float32`` (for example because a loader called this helper right after
+    reading a file) are left untouched, so repeated calls are cheap. Returns a
+    dataframe that never aliases modified input columns and the subset of
+    ``numeric_cols`` present in the dataframe.
     """
-    prepared = df.copy()
-    available_cols = [col for col in numeric_cols if col in prepared.columns]
-    for col in available_cols:
-        prepared[col] = to_numeric(prepared[col])
+    available_cols = [col for col in numeric_cols if col in df.columns]
+    converted = {
+        col: to_numeric(df[col], downcast="float")
+        for col in available_cols
+        if df[col].dtype != np.float32
+    }
+    prepared = df.assign(**converted) if converted else df.copy(deep=False)
     return prepared, available_cols
 
 
@@ -50,10 +58,11 @@ def find_stop_rows(
     if zero_threshold is None:
         zero_threshold = max(1, len(available_cols) // 2)
 
-    stopped_mask = (
-        prepared[execution_col].isin(stopped_states)
-        & ((prepared[available_cols] == 0).sum(axis=1) >= zero_threshold)
-    )
+    # Count zeros with one reduction over a contiguous float32 block instead
+    # of materializing a boolean DataFrame and summing it column by column.
+    values = prepared[available_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+    zero_counts = np.count_nonzero(values == 0, axis=1)
+    stopped_mask = prepared[execution_col].isin(stopped_states).to_numpy() & (zero_counts >= zero_threshold)
     return prepared.loc[stopped_mask].copy(), available_cols
 
 
@@ -65,32 +74,42 @@ def group_stop_rows(
     machine_col: str = "machine",
     default_machine: str = "UNKNOWN",
 ) -> pd.DataFrame:
-    """Group nearby stop rows into machine-specific stop intervals."""
+    """Group nearby stop rows into machine-specific stop intervals.
+
+    Rows are ordered by machine and time; a new interval starts at each
+    machine's first row and wherever the gap to the previous row exceeds
+    ``max_gap_seconds``. Interval boundaries are found with NumPy on integer
+    machine codes and nanosecond timestamps, so the work is a sort plus a few
+    array passes instead of a per-row Python loop.
+    """
     if df.empty:
         return pd.DataFrame(columns=[machine_col, "start", "end", "duration_s"])
 
-    grouped_rows: list[list[object]] = []
-    working = df.sort_values(time_col).copy()
-    working[machine_col] = working.get(machine_col, default_machine)
-
-    for machine, machine_df in working.groupby(machine_col):
-        start = None
-        last = None
-
-        for t in machine_df[time_col]:
-            if start is None:
-                start, last = t, t
-                continue
-
-            gap = (t - last).total_seconds()
-            if gap <= max_gap_seconds:
-                last = t
-                continue
-
-            grouped_rows.append([machine, start, last, (last - start).total_seconds()])
-            start, last = t, t
-
-        if start is not None:
-            grouped_rows.append([machine, start, last, (last - start).total_seconds()])
+    machines = df[machine_col] if machine_col in df.columns else pd.Series(default_machine, index=df.index)
+    codes, machine_values = pd.factorize(machines, sort=True)
+    present = codes >= 0
+    times = df[time_col][present]
+    codes = codes[present]
+    if codes.size == 0:
+        return pd.DataFrame(columns=[machine_col, "start", "end", "duration_s"])
 
-    return pd.DataFrame(grouped_rows, columns=[machine_col, "start", "end", "duration_s"])
+    ticks = pd.DatetimeIndex(times).as_unit("ns").asi8
+    order = np.lexsort((ticks, codes))
+    codes = codes[order]
+    ticks = ticks[order]
+
+    starts_interval = np.empty(codes.size, dtype=bool)
+    starts_interval[0] = True
+    starts_interval[1:] = (codes[1:] != codes[:-1]) | (np.diff(ticks) > max_gap_seconds * 1e9)
+    start_idx = np.flatnonzero(starts_interval)
+    end_idx = np.append(start_idx[1:] - 1, codes.size - 1)
+
+    sorted_times = times.iloc[order]
+    return pd.DataFrame(
+        {
+            machine_col: machine_values.take(codes[start_idx]),
+            "start": sorted_times.iloc[start_idx].array,
+            "end": sorted_times.iloc[end_idx].array,
+            "duration_s": (ticks[end_idx] - ticks[start_idx]) / 1e9,
+        }
+    )
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from catalog.common.basic_metrics import (
+    build_basic_metrics_dataset,
+    iter_basic_metrics_frames,
+    iter_basic_metrics_rows,
+    read_basic_metrics_frame,
+)
+
+
+def _write_jsonl(path: Path, rows: list[dict[str, object]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
+
+
+def _build(tmp_path: Path) -> int:
+    _write_jsonl(
+        tmp_path / "2026-03-23.jsonl",
+        [
+            {"timestamp": "2026-03-23T23:59:59+02:00", "machine": "QuickTurn", "sequence": 10},
+            {"machine": "QuickTurn", "sequence": 11},
+            {"timestamp": "not-a-time", "machine": "VTC", "sequence": 12},
+            {"timestamp": "2026-03-24T00:00:01", "sequence": "x"},
+            {"timestamp": "2026-03-24T00:00:02", "machine": "IG500", "sequence": "13"},
+        ],
+    )
+    _, written_rows = build_basic_metrics_dataset(tmp_path)
+    return written_rows
+
+
+def test_read_basic_metrics_frame_returns_typed_columns(tmp_path: Path) -> None:
+    assert _build(tmp_path) == 3
+
+    frame = read_basic_metrics_frame(tmp_path)
+
+    assert frame["date"].tolist() == ["2026-03-23", "2026-03-24", "2026-03-24"]
+    assert frame["machine"].isna().tolist() == [False, True, False]
+    assert frame["sequence"].tolist() == [10, pd.NA, 13]
+    assert frame.loc[0, "timestamp"] == pd.Timestamp("2026-03-23T21:59:59", tz="UTC")
+
+
+def test_read_basic_metrics_frame_reads_only_requested_columns(tmp_path: Path) -> None:
+    _build(tmp_path)
+
+    frame = read_basic_metrics_frame(tmp_path, columns=["sequence"])
+
+    assert list(frame.columns) == ["timestamp", "date", "sequence"]
+
+
+def test_iter_basic_metrics_rows_matches_dataset(tmp_path: Path) -> None:
+    _build(tmp_path)
+
+    rows = list(iter_basic_metrics_rows(tmp_path))
+
+    assert [(machine, sequence) for _, machine, sequence in rows] == [
+        ("QuickTurn", 10),
+        (None, None),
+        ("IG500", 13),
+    ]
+    assert rows[0][0].utcoffset() is not None
+
+
+def test_iter_basic_metrics_frames_yields_bounded_chunks_in_order(tmp_path: Path) -> None:
+    _build(tmp_path)
+
+    chunks = list(iter_basic_metrics_frames(tmp_path, columns=["sequence"], batch_rows=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks)["sequence"].tolist() == [10, pd.NA, 13]
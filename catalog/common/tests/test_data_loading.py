@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+from catalog.common.data_loading import iter_jsonl_records, load_jsonl_dataframe, map_jsonl_files
+
+
+def _write_jsonl(path: Path, rows: list[dict[str, object]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
+
+
+def test_load_jsonl_dataframe_reads_well_formed_file(tmp_path: Path) -> None:
+    source = tmp_path / "2026-03-23.jsonl"
+    _write_jsonl(
+        source,
+        [
+            {"timestamp": "2026-03-23T12:00:00", "machine": "QuickTurn", "Srpm": 800},
+            {"timestamp": "2026-03-23T12:00:01", "machine": "QuickTurn", "execution": "ACTIVE"},
+        ],
+    )
+
+    frame = load_jsonl_dataframe(source)
+
+    assert list(frame["timestamp"]) == ["2026-03-23T12:00:00", "2026-03-23T12:00:01"]
+    assert frame.loc[0, "Srpm"] == 800
+    assert frame.loc[1, "execution"] == "ACTIVE"
+
+
+def test_load_jsonl_dataframe_falls_back_to_tolerant_parser(tmp_path: Path) -> None:
+    source = tmp_path / "2026-03-23.jsonl"
+    source.write_text(
+        '{"timestamp": "2026-03-23T12:00:00", "Srpm": 800}\n'
+        "{not json\n"
+        "[1, 2]\n"
+        '{"timestamp": "2026-03-23T12:00:01", "Srpm": 0}\n',
+        encoding="utf-8",
+    )
+    warnings: list[str] = []
+
+    frame = load_jsonl_dataframe(source, on_malformed_json=warnings.append)
+
+    assert list(frame["Srpm"]) == [800, 0]
+    assert len(warnings) == 1
+    assert "line 2" in warnings[0]
+
+
+def test_load_jsonl_dataframe_skips_scalar_lines_and_keeps_exact_floats(tmp_path: Path) -> None:
+    source = tmp_path / "2026-03-23.jsonl"
+    source.write_text(
+        '"str"\n'
+        '{"timestamp": "2026-03-23T12:00:00", "Sload": 0.1234567890123456}\n'
+        '{"timestamp": "2026-03-23T12:00:01", "Sload": 2.5}\n',
+        encoding="utf-8",
+    )
+
+    frame = load_jsonl_dataframe(source)
+
+    assert list(frame.columns) == ["timestamp", "Sload"]
+    assert list(frame["timestamp"]) == ["2026-03-23T12:00:00", "2026-03-23T12:00:01"]
+    assert frame.loc[0, "Sload"] == 0.1234567890123456
+
+
+def test_load_jsonl_dataframe_parses_floats_like_json(tmp_path: Path) -> None:
+    values = [0.1 * index + 1e-7 * index**2 for index in range(1, 200)]
+    source = tmp_path / "2026-03-23.jsonl"
+    _write_jsonl(source, [{"timestamp": "2026-03-23T12:00:00", "Sload": value} for value in values])
+
+    frame = load_jsonl_dataframe(source)
+
+    assert list(frame["Sload"]) == values
+
+
+def test_iter_jsonl_records_accepts_non_finite_literals_and_skips_bad_bytes(tmp_path: Path) -> None:
+    source = tmp_path / "2026-03-23.jsonl"
+    source.write_bytes(
+        b'{"timestamp": "2026-03-23T12:00:00", "Sload": NaN}\n'
+        b'{"timestamp": "\xff"}\n'
+        b"\n"
+        b'{"timestamp": "2026-03-23T12:00:01", "Sload": 1.5}'
+    )
+    warnings: list[str] = []
+
+    records = list(iter_jsonl_records(source, on_malformed_json=warnings.append))
+
+    assert [record["timestamp"] for record in records] == ["2026-03-23T12:00:00", "2026-03-23T12:00:01"]
+    assert math.isnan(records[0]["Sload"])
+    assert len(warnings) == 1
+    assert "line 2" in warnings[0]
+
+
+def test_iter_jsonl_records_handles_empty_file(tmp_path: Path) -> None:
+    source = tmp_path / "empty.jsonl"
+    source.write_bytes(b"")
+
+    assert list(iter_jsonl_records(source)) == []
+
+
+def test_map_jsonl_files_keeps_input_order_with_worker_processes(tmp_path: Path) -> None:
+    paths = [tmp_path / f"2026-03-{day}.jsonl" for day in (25, 23, 24)]
+    for path in paths:
+        _write_jsonl(path, [{"timestamp": f"{path.stem}T00:00:00"}])
+
+    frames = map_jsonl_files(load_jsonl_dataframe, paths, max_workers=2)
+
+    assert [frame.loc[0, "timestamp"] for frame in frames] == [
+        "2026-03-25T00:00:00",
+        "2026-03-23T00:00:00",
+        "2026-03-24T00:00:00",
+    ]
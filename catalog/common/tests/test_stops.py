@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from catalog.common.stops import find_stop_rows, group_stop_rows, prepare_stop_numeric_columns
+
+
+def _timestamps(*values: str) -> list[pd.Timestamp]:
+    return [pd.Timestamp(value) for value in values]
+
+
+def test_group_stop_rows_splits_on_gap_and_machine() -> None:
+    stops = pd.DataFrame(
+        {
+            "timestamp": _timestamps(
+                "2026-03-23 08:00:00",
+                "2026-03-23 08:00:00",
+                "2026-03-23 08:00:01",
+                "2026-03-23 08:00:02",
+                "2026-03-23 08:00:10",
+                "2026-03-23 08:00:11",
+            ),
+            "machine": ["A", "B", "A", "A", "A", "B"],
+        }
+    )
+
+    grouped = group_stop_rows(stops, max_gap_seconds=2)
+
+    assert grouped.to_dict(orient="records") == [
+        {
+            "machine": "A",
+            "start": pd.Timestamp("2026-03-23 08:00:00"),
+            "end": pd.Timestamp("2026-03-23 08:00:02"),
+            "duration_s": 2.0,
+        },
+        {
+            "machine": "A",
+            "start": pd.Timestamp("2026-03-23 08:00:10"),
+            "end": pd.Timestamp("2026-03-23 08:00:10"),
+            "duration_s": 0.0,
+        },
+        {
+            "machine": "B",
+            "start": pd.Timestamp("2026-03-23 08:00:00"),
+            "end": pd.Timestamp("2026-03-23 08:00:00"),
+            "duration_s": 0.0,
+        },
+        {
+            "machine": "B",
+            "start": pd.Timestamp("2026-03-23 08:00:11"),
+            "end": pd.Timestamp("2026-03-23 08:00:11"),
+            "duration_s": 0.0,
+        },
+    ]
+
+
+def test_group_stop_rows_uses_default_machine_and_handles_unsorted_input() -> None:
+    stops = pd.DataFrame(
+        {"timestamp": _timestamps("2026-03-23 08:00:02", "2026-03-23 08:00:00", "2026-03-23 08:00:01")}
+    )
+
+    grouped = group_stop_rows(stops, max_gap_seconds=1)
+
+    assert list(grouped["machine"]) == ["UNKNOWN"]
+    assert grouped.loc[0, "start"] == pd.Timestamp("2026-03-23 08:00:00")
+    assert grouped.loc[0, "duration_s"] == 2.0
+
+
+def test_group_stop_rows_empty_input() -> None:
+    grouped = group_stop_rows(pd.DataFrame(columns=["timestamp", "machine"]), max_gap_seconds=2)
+
+    assert grouped.empty
+    assert list(grouped.columns) == ["machine", "start", "end", "duration_s"]
+
+
+def test_find_stop_rows_requires_stopped_state_and_half_zero_signals() -> None:
+    frame = pd.DataFrame(
+        {
+            "execution": ["STOPPED", "STOPPED", "ACTIVE", "STOPPED"],
+            "Srpm": [0, 800, 0, "UNAVAILABLE"],
+            "Fact": [0, 100, 0, 0],
+            "Xfrt": [5, 5, 0, 0],
+        }
+    )
+
+    stop_rows, available_cols = find_stop_rows(
+        frame,
+        stopped_states=["STOPPED"],
+        numeric_cols=["Srpm", "Fact", "Xfrt", "Yfrt"],
+    )
+
+    assert available_cols == ["Srpm", "Fact", "Xfrt"]
+    assert list(stop_rows.index) == [0, 3]
+
+
+def test_prepare_stop_numeric_columns_downcasts_to_float32() -> None:
+    frame = pd.DataFrame({"Srpm": [0, 800], "Fact": ["UNAVAILABLE", "12.5"], "execution": ["STOPPED", "ACTIVE"]})
+
+    prepared, available_cols = prepare_stop_numeric_columns(frame, ["Srpm", "Fact", "Zfrt"])
+
+    assert available_cols == ["Srpm", "Fact"]
+    assert prepared["Srpm"].dtype == "float32"
+    assert prepared["Fact"].isna().tolist() == [True, False]
+    assert frame["Srpm"].dtype == "int64"
+
+
+def test_prepare_stop_numeric_columns_skips_float32_columns() -> None:
+    frame = pd.DataFrame({"Srpm": pd.Series([0.0, 800.0], dtype="float32"), "Fact": ["0", "UNAVAILABLE"]})
+
+    prepared, _ = prepare_stop_numeric_columns(frame, ["Srpm", "Fact"])
+    prepared["Srpm"] = prepared["Srpm"] + 1
+
+    assert prepared["Fact"].dtype == "float32"
+    assert frame["Srpm"].tolist() == [0.0, 800.0]
+    assert frame["Fact"].tolist() == ["0", "UNAVAILABLE"]
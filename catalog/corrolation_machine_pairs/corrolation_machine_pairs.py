@@ -8,9 +8,9 @@ computed across machines based on those hourly stop-duration profiles.
 
 Pipeline:
 1. Load JSONL telemetry files from ``data/``
-2. Parse timestamps and sort records chronologically
-3. Identify likely stop rows using execution state and numeric signal values
-4. Group nearby stop rows into stop intervals
+2. Parse timestamps and identify likely stop rows, one worker process per file
+3. Combine the stop rows of all files
+4. Group nearby stop rows into stop intervals across all files in one pass
 5. Aggregate total stop duration per machine per hour
 6. Compute machine-to-machine correlations
 
@@ -24,13 +24,13 @@ Notes:
 - Results depend strongly on the stop heuristic and the temporal grouping rule.
 """
 
-import json
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
-from catalog.common.stops import find_stop_rows, group_stop_rows
+from catalog.common.data_loading import load_jsonl_dataframe, map_jsonl_files
+from catalog.common.stops import find_stop_rows, group_stop_rows, prepare_stop_numeric_columns
 from catalog.common.telemetry_prep import prepare_timestamp_column
 
 # Directory containing input JSONL telemetry files.
@@ -39,6 +39,9 @@ DATA_DIR = Path("data")
 # Execution states treated as explicitly stopped.
 STOPPED_STATES = ["STOPPED"]
 
+# Numeric motion/activity signals used by the stop heuristic.
+STOP_NUMERIC_COLS = ["Srpm", "Fact", "Xfrt", "Yfrt", "Zfrt"]
+
 # Maximum allowed gap (in seconds) between stopped rows before they are split
 # into separate stop intervals.
 MAX_GAP_SECONDS = 2
@@ -61,24 +64,15 @@ def load_jsonl(file_path):
     -------
     pandas.DataFrame
         Parsed telemetry rows with timestamps converted to datetime and sorted
-        chronologically. Returns an empty DataFrame if the file is unusable.
+        chronologically, and ``STOP_NUMERIC_COLS`` coerced to ``float32`` once
+        at load time. Returns an empty DataFrame if the file is unusable.
     """
-    records = []
-    with open(file_path, "r") as f:
-        for line in f:
-            try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-
-    if not records:
-        return pd.DataFrame()
-
-    df = pd.DataFrame(records)
-    if "timestamp" not in df.columns:
+    df = load_jsonl_dataframe(file_path)
+    if df.empty or "timestamp" not in df.columns:
         return pd.DataFrame()
 
-    return prepare_timestamp_column(df, time_col="timestamp", drop_invalid=True, sort=True)
+    df = prepare_timestamp_column(df, time_col="timestamp", drop_invalid=True, sort=True, format="ISO8601")
+    return prepare_stop_numeric_columns(df, STOP_NUMERIC_COLS)[0]
 
 
 def find_stops(df):
@@ -108,11 +102,10 @@ def find_stops(df):
     This is a heuristic stop detector. It does not guarantee that all returned
     rows correspond to true operational stops.
     """
-    numeric_cols = ["Srpm", "Fact", "Xfrt", "Yfrt", "Zfrt"]
     stop_rows, available_cols = find_stop_rows(
         df,
         stopped_states=STOPPED_STATES,
-        numeric_cols=numeric_cols,
+        numeric_cols=STOP_NUMERIC_COLS,
         execution_col="execution",
     )
     if not available_cols or "execution" not in df.columns:
@@ -158,55 +151,80 @@ def group_stops(df, max_gap_seconds=MAX_GAP_SECONDS):
     return group_stop_rows(df, max_gap_seconds=max_gap_seconds)
 
 
+def find_file_stops(file_path):
+    """
+    Load one JSONL file and return its stop-candidate rows.
+
+    Runs in a worker process, so only the (much smaller) stop rows are sent
+    back to the parent instead of the full telemetry frame.
+
+    Parameters
+    ----------
+    file_path : pathlib.Path
+        Path to the JSONL file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Output of :func:`find_stops`, or an empty DataFrame for unusable files.
+    """
+    df = load_jsonl(file_path)
+    if df.empty:
+        return df
+    return find_stops(df)
+
+
 def main():
     """
     Run the full stop-correlation analysis.
 
-    For each JSONL file:
-    - load telemetry
-    - detect stop rows
-    - group stop rows into intervals
-
-    Then:
-    - combine all intervals
-    - bucket them by hour
+    Steps:
+    - load telemetry and detect stop rows for every JSONL file in parallel
+    - group the combined stop rows into intervals in a single pass
+    - bucket intervals by hour
     - sum stop duration per machine per hour
     - compute machine correlation matrix
     - write the correlation matrix to CSV
     """
     all_files = sorted(DATA_DIR.glob("*.jsonl"))
-    all_intervals = []
-
-    for file_path in all_files:
-        df = load_jsonl(file_path)
-        if df.empty:
-            continue
-
-        stops = find_stops(df)
-        grouped = group_stops(stops)
-
-        if not grouped.empty:
-            all_intervals.append(grouped)
-
-    if not all_intervals:
+    frames = [frame for frame in map_jsonl_files(find_file_stops, all_files) if not frame.empty]
+    if not frames:
         print("No data found.")
         return
 
-    df = pd.concat(all_intervals, ignore_index=True)
+    # Group stops once over all files rather than once per file. Stop-row
+    # detection is row-wise and runs per file; grouping needs every file so
+    # that stop intervals continue across daily file boundaries.
+    df = group_stops(pd.concat(frames, ignore_index=True))
+    if df.empty:
+        print("No data found.")
+        return
 
     # Floor each stop interval start time to the containing hour so that stop
     # duration can be aggregated into hourly buckets.
     df["hour"] = df["start"].dt.floor("h")
 
-    # Aggregate total stop time per machine per hour.
-    pivot = (
-        df.groupby(["hour", "machine"])["duration_s"]
-        .sum()
-        .unstack(fill_value=0)
+    # Aggregate total stop time per machine per hour. A categorical machine
+    # column lets the group-sum run on integer codes, and ``observed=True``
+    # limits the output to machines that actually have stop intervals.
+    df["machine"] = df["machine"].astype("category")
+    pivot = df.pivot_table(
+        index="hour",
+        columns="machine",
+        values="duration_s",
+        aggfunc="sum",
+        fill_value=0,
+        observed=True,
     )
 
-    # Compute correlation across machine stop-duration profiles.
-    corr = pivot.corr()
+    # Compute correlation across machine stop-duration profiles. The pivot is
+    # dense (no NaN), so one np.corrcoef call on the contiguous matrix replaces
+    # pandas' pairwise column loop. Machines with constant profiles yield NaN,
+    # as with DataFrame.corr; the diagonal is pinned to exactly 1 otherwise.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr_values = np.atleast_2d(np.corrcoef(pivot.to_numpy(dtype=np.float64), rowvar=False))
+    np.fill_diagonal(corr_values, np.where(np.isnan(np.diag(corr_values)), np.nan, 1.0))
+    corr = pd.DataFrame(corr_values, index=pivot.columns, columns=pivot.columns)
 
     corr.to_csv(OUTPUT_CORRELATION_CSV, index=True)
     print(f"\nSaved correlation matrix CSV to: {OUTPUT_CORRELATION_CSV.resolve()}")
@@ -22,7 +22,8 @@ SCRIPT_ROOT = Path(__file__).resolve().parents[2]
 if str(SCRIPT_ROOT) not in sys.path:
     sys.path.insert(0, str(SCRIPT_ROOT))
 
-from catalog.common.data_loading import iter_records_with_parsed_timestamps
+from catalog.common.data_loading import iter_jsonl_files, load_jsonl_dataframe
+from catalog.common.telemetry_prep import prepare_timestamp_column
 
 # Folder containing input JSONL files.
 DATA_DIR = "data"
@@ -49,13 +50,19 @@ def _resolve_machine_day_output_csv() -> Path:
 
 
 def _build_machine_day_summary(frame: pd.DataFrame) -> pd.DataFrame:
+    # Group on midnight-normalized timestamps (vectorized integer math) and only
+    # format the few distinct days afterwards, instead of building a Python
+    # ``date`` object for every row.
     summary = (
-        frame.assign(date=frame["timestamp"].dt.date.astype(str), machine=frame["machine"].astype("string"))
-        .groupby(["date", "machine"], dropna=False)
+        frame.groupby(
+            [frame["timestamp"].dt.normalize().rename("date"), frame["machine"].astype("string")],
+            dropna=False,
+        )
         .size()
         .reset_index(name="value")
         .sort_values(["date", "machine"])
     )
+    summary["date"] = summary["date"].dt.strftime("%Y-%m-%d")
     summary["machine"] = summary["machine"].fillna("unknown").astype(str)
     summary["value"] = summary["value"].astype(int)
     return summary[["date", "machine", "value"]]
@@ -71,30 +78,34 @@ def _warn_malformed_json(message: str) -> None:
     print(f"Error parsing line: {message}")
 
 
-def _warn_invalid_timestamp(file_path: Path, raw_timestamp: object) -> None:
+def _load_frames() -> list[pd.DataFrame]:
     """
-    Report records whose timestamp cannot be parsed.
-    """
-    print(f"Error parsing line in {file_path.name}: Invalid isoformat string: {raw_timestamp}")
+    Load top-level JSONL files as DataFrames with parsed timestamps.
 
+    Each file is parsed in one vectorized pass. Rows whose timestamp cannot be
+    parsed are dropped and reported once per file.
+    """
+    frames = []
+    for file_path in iter_jsonl_files(DATA_DIR, recursive=False):
+        frame = load_jsonl_dataframe(file_path, on_malformed_json=_warn_malformed_json)
+        if frame.empty or "timestamp" not in frame.columns:
+            continue
+        row_count = len(frame)
+        frame = prepare_timestamp_column(frame, time_col="timestamp", drop_invalid=True, sort=False, format="ISO8601")
+        if len(frame) < row_count:
+            print(f"Skipped {row_count - len(frame)} rows with invalid timestamps in {file_path.name}")
+        if not frame.empty:
+            frames.append(frame)
+    return frames
 
-records = []
 
 # Read top-level JSONL files only. This preserves the script's original behavior
 # and avoids unexpectedly traversing nested directories.
-for _, entry in iter_records_with_parsed_timestamps(
-    DATA_DIR,
-    recursive=False,
-    allow_z_suffix=True,
-    on_malformed_json=_warn_malformed_json,
-    on_invalid_timestamp=_warn_invalid_timestamp,
-):
-    records.append(entry)
-
-if not records:
+frames = _load_frames()
+if not frames:
     raise SystemExit("No valid records found in data folder.")
 
-df = pd.DataFrame(records)
+df = pd.concat(frames, ignore_index=True)
 
 # These columns are the minimum needed for grouping logic.
 required_cols = {"timestamp", "machine"}
@@ -102,8 +113,6 @@ if not required_cols.issubset(df.columns):
     raise ValueError(f"Missing required columns: {required_cols - set(df.columns)}")
 
 # Group by calendar day rather than full timestamp.
-df["date"] = df["timestamp"].dt.date
-
 summary = _build_machine_day_summary(df)
 summary_path = _resolve_machine_day_output_csv()
 summary.to_csv(summary_path, index=False)
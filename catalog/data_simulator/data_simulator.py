@@ -18,20 +18,28 @@ interval.
 Notes:
 - Data is loaded from top-level JSONL files in ``data/``.
 - Data is cached with ``st.cache_data`` to avoid repeated full reloads.
-- Timestamps are parsed with ``datetime.fromisoformat`` and invalid rows are
-  skipped with a warning.
+- Files are parsed with ``pandas.read_json`` and timestamps are converted in
+  one vectorized pass; invalid rows are skipped with a warning.
 - The current index slider is display-only in this version.
+- Plot figures are created once per machine/variable and kept in session
+  state; each tick only updates the line data and the current-point marker.
 """
 
-import json
-import os
+import sys
 import time
-from datetime import datetime
+from pathlib import Path
 
 import matplotlib.pyplot as plt
 import pandas as pd
 import streamlit as st
 
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from catalog.common.data_loading import iter_jsonl_files, load_jsonl_dataframe
+from catalog.common.telemetry_prep import prepare_timestamp_column
+
 # Folder containing input JSONL files.
 DATA_DIR = "data"
 
@@ -44,9 +52,9 @@ def load_data():
     """
     Load and cache telemetry data from JSONL files.
 
-    The loader scans top-level ``*.jsonl`` files in ``data/``, parses each line
-    as JSON, converts the ``timestamp`` field to ``datetime``, and returns a
-    single timestamp-sorted DataFrame.
+    The loader scans top-level ``*.jsonl`` files in ``data/``, parses each file
+    into a DataFrame, converts the combined ``timestamp`` column to
+    ``datetime``, and returns a single timestamp-sorted DataFrame.
 
     Returns
     -------
@@ -56,26 +64,33 @@ def load_data():
     Behavior
     --------
     - Blank lines are skipped.
-    - Rows with parsing errors are skipped and reported as Streamlit warnings.
+    - Malformed lines and rows with invalid timestamps are skipped and reported
+      as Streamlit warnings.
     - Data is cached to reduce repeated I/O on reruns.
     """
-    records = []
-
-    for filename in sorted(os.listdir(DATA_DIR)):
-        if filename.endswith(".jsonl"):
-            filepath = os.path.join(DATA_DIR, filename)
-            with open(filepath, "r") as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            entry = json.loads(line)
-                            entry["timestamp"] = datetime.fromisoformat(entry["timestamp"])
-                            records.append(entry)
-                        except Exception as e:
-                            st.warning(f"Parse error in {filename}: {e}")
-
-    df = pd.DataFrame(records)
-    df.sort_values("timestamp", inplace=True)
+    frames = []
+    for filepath in iter_jsonl_files(DATA_DIR, recursive=False):
+        frame = load_jsonl_dataframe(
+            filepath,
+            on_malformed_json=lambda message: st.warning(f"Parse error in {message}"),
+        )
+        if not frame.empty and "timestamp" in frame.columns:
+            frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True)
+    row_count = len(df)
+    df = prepare_timestamp_column(
+        df,
+        time_col="timestamp",
+        drop_invalid=True,
+        sort=True,
+        format="ISO8601",
+    )
+    if len(df) < row_count:
+        st.warning(f"Skipped {row_count - len(df)} rows with invalid timestamps.")
     df.reset_index(drop=True, inplace=True)
     return df
 
@@ -98,6 +113,7 @@ if "last_run" not in st.session_state:
 st.title("MTConnect Data Simulator with Playback")
 
 # If machine labels are available, filter the dataset to one machine.
+selected_machine = None
 if "machine" in df.columns:
     machines = df["machine"].dropna().unique()
     selected_machine = st.selectbox("Select machine", machines)
@@ -148,20 +164,36 @@ current = df.iloc[st.session_state.index]
 st.subheader(f"Time: {current['timestamp']}")
 st.json(current[selected_vars].to_dict())
 
+# Extract plotted arrays once per rerun instead of slicing Series per variable.
+timestamps = df["timestamp"].to_numpy()
+series_values = {var: df[var].to_numpy(dtype=float, na_value=float("nan")) for var in selected_vars}
+position = st.session_state.index
+
+# Figures are cached per machine/variable so playback ticks reuse the same
+# artists instead of rebuilding the whole figure.
+if "figures" not in st.session_state:
+    st.session_state.figures = {}
+
 # Plot each selected variable from the beginning up to the current playback index.
 for var in selected_vars:
-    fig, ax = plt.subplots(figsize=(8, 2))
-    ax.plot(
-        df["timestamp"][: st.session_state.index + 1],
-        df[var][: st.session_state.index + 1],
-        label=var,
-    )
-    ax.scatter([current["timestamp"]], [current[var]], color="red")
-    ax.set_ylabel(var)
-    ax.set_xlabel("Time")
-    ax.set_title(var)
-    ax.grid(True)
-    st.pyplot(fig)
+    values = series_values[var]
+    figure_key = (selected_machine, var)
+    if figure_key not in st.session_state.figures:
+        fig, ax = plt.subplots(figsize=(8, 2))
+        (line,) = ax.plot(timestamps[:1], values[:1], label=var)
+        (marker,) = ax.plot(timestamps[:1], values[:1], "o", color="red")
+        ax.set_ylabel(var)
+        ax.set_xlabel("Time")
+        ax.set_title(var)
+        ax.grid(True)
+        st.session_state.figures[figure_key] = (fig, ax, line, marker)
+
+    fig, ax, line, marker = st.session_state.figures[figure_key]
+    line.set_data(timestamps[: position + 1], values[: position + 1])
+    marker.set_data(timestamps[position : position + 1], values[position : position + 1])
+    ax.relim()
+    ax.autoscale_view()
+    st.pyplot(fig, clear_figure=False)
 
 # Advance playback by one row when enough time has elapsed.
 if st.session_state.playing:
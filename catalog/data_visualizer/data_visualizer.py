@@ -5,11 +5,16 @@ shared DT-foundation helpers for loading, telemetry preparation, state/situation
 inference, and interval/candidate derivation.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.collections import PolyCollection
 from matplotlib.patches import Patch
 
 from catalog.common.data_loading import iter_jsonl_files, load_jsonl_dataframe
@@ -99,6 +104,13 @@ def load_prepared_frames() -> list[pd.DataFrame]:
     return frames
 
 
+def _naive_utc(values: pd.Series) -> pd.Series:
+    """Return datetimes as naive UTC so matplotlib converts them consistently."""
+    if values.dt.tz is not None:
+        return values.dt.tz_convert("UTC").dt.tz_localize(None)
+    return values
+
+
 def plot_day_timeline(interval_df_day, output_path=None, show=False):
     if interval_df_day.empty:
         return
@@ -116,23 +128,31 @@ def plot_day_timeline(interval_df_day, output_path=None, show=False):
     fig, ax = plt.subplots(figsize=(FIG_WIDTH, fig_height))
     y_positions = {m: i for i, m in enumerate(machines)}
 
-    for _, row in interval_df_day.iterrows():
-        y = y_positions[row["machine_id"]]
-        start = row["start"]
-        end = row["end"]
-        color = state_colors.get(row["state"], "black")
-
-        if start == end:
-            end = start + pd.Timedelta(seconds=1)
-
-        ax.barh(
-            y=y,
-            width=(end - start).total_seconds() / 86400.0,
-            left=mdates.date2num(start),
-            height=0.6,
-            color=color,
-            edgecolor="none",
+    # Draw every interval as one PolyCollection instead of one barh artist per
+    # row: the rectangles are computed as arrays and rendered in a single call.
+    y = interval_df_day["machine_id"].map(y_positions).to_numpy(dtype=float)
+    starts = pd.Series(pd.DatetimeIndex(interval_df_day["start"]))
+    ends = pd.Series(pd.DatetimeIndex(interval_df_day["end"]))
+    ends = ends.where(ends != starts, starts + pd.Timedelta(seconds=1))
+    left = mdates.date2num(_naive_utc(starts).to_numpy())
+    width = ((ends - starts).dt.total_seconds() / 86400.0).to_numpy()
+    colors = [state_colors.get(state, "black") for state in interval_df_day["state"]]
+
+    drawable = ~np.isnan(y)
+    x0, x1 = left[drawable], left[drawable] + width[drawable]
+    y0, y1 = y[drawable] - 0.3, y[drawable] + 0.3
+    verts = np.stack(
+        [np.column_stack(corner) for corner in ((x0, y0), (x0, y1), (x1, y1), (x1, y0))],
+        axis=1,
+    )
+    ax.add_collection(
+        PolyCollection(
+            verts,
+            facecolors=[color for color, keep in zip(colors, drawable) if keep],
+            edgecolors="none",
         )
+    )
+    ax.autoscale_view()
 
     ax.set_yticks(list(y_positions.values()))
     ax.set_yticklabels(list(y_positions.keys()))
@@ -166,6 +186,31 @@ def plot_day_timeline(interval_df_day, output_path=None, show=False):
         plt.close(fig)
 
 
+def _save_day_timeline(job: tuple[pd.DataFrame, Path]) -> None:
+    """Render one day's timeline to PNG; runs in a worker process."""
+    day_intervals, output_path = job
+    plot_day_timeline(day_intervals, output_path=output_path)
+
+
+def save_day_timelines(jobs: list[tuple[pd.DataFrame, Path]]) -> None:
+    """Render day timelines in parallel with the non-interactive Agg backend.
+
+    Figures are independent and rendering is CPU-bound, so each worker process
+    draws and saves whole figures. A single job is rendered inline.
+    """
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        for job in jobs:
+            _save_day_timeline(job)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=matplotlib.use,
+        initargs=("Agg",),
+    ) as executor:
+        list(executor.map(_save_day_timeline, jobs))
+
+
 def main():
     if SAVE_FIGURES:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -256,15 +301,15 @@ def main():
         print(candidate_df.head(50).to_string(index=False))
 
     if SAVE_FIGURES or SHOW_FIGURES:
-        unique_days = sorted(interval_df["date"].dropna().unique().tolist())
-        for day_value in unique_days:
-            day_intervals = interval_df[interval_df["date"] == day_value].copy()
-            if day_intervals.empty:
-                continue
-
-            filename = f"timeline_{day_value}.png"
-            output_path = OUTPUT_DIR / filename
-            plot_day_timeline(day_intervals, output_path=output_path if SAVE_FIGURES else None, show=SHOW_FIGURES)
+        day_jobs = [
+            (day_intervals, OUTPUT_DIR / f"timeline_{day_value}.png")
+            for day_value, day_intervals in interval_df.groupby("date", sort=True)
+        ]
+        if SHOW_FIGURES:
+            for day_intervals, output_path in day_jobs:
+                plot_day_timeline(day_intervals, output_path=output_path if SAVE_FIGURES else None, show=True)
+        else:
+            save_day_timelines(day_jobs)
         print(f"\nDone. Images are in: {OUTPUT_DIR.resolve()}")
     else:
         print("\nTimeline PNG generation disabled; use timeline_intervals.csv and candidate_events.csv.")
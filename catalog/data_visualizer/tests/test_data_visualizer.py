@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+import pandas as pd
+
 from catalog.data_visualizer import data_visualizer
 
 
@@ -30,3 +32,26 @@ def test_load_prepared_frames_reads_nested_session_data(tmp_path, monkeypatch):
     assert len(frames) == 1
     assert frames[0]["machine_id"].tolist() == ["machine-a"]
     assert frames[0]["source_file"].tolist() == ["machine-a/2026-04-23.jsonl"]
+
+
+def test_save_day_timelines_writes_one_png_per_day(tmp_path):
+    intervals = pd.DataFrame(
+        {
+            "date": ["2026-04-23", "2026-04-23", "2026-04-24"],
+            "machine_id": ["machine-a", "machine-b", "machine-a"],
+            "state": ["active", "idle", "intervention_candidate"],
+            "start": pd.to_datetime(["2026-04-23T08:00:00", "2026-04-23T09:00:00", "2026-04-24T08:00:00"]),
+            "end": pd.to_datetime(["2026-04-23T08:30:00", "2026-04-23T09:00:00", "2026-04-24T10:00:00"]),
+        }
+    )
+    jobs = [
+        (day_intervals, tmp_path / f"timeline_{day_value}.png")
+        for day_value, day_intervals in intervals.groupby("date", sort=True)
+    ]
+
+    data_visualizer.save_day_timelines(jobs)
+
+    assert sorted(path.name for path in tmp_path.glob("*.png")) == [
+        "timeline_2026-04-23.png",
+        "timeline_2026-04-24.png",
+    ]
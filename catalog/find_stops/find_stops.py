@@ -4,35 +4,36 @@ from pathlib import Path
 
 import pandas as pd
 
-from catalog.common.data_loading import iter_jsonl_files, load_jsonl_dataframe
-from catalog.common.stops import find_stop_rows, group_stop_rows
+from catalog.common.data_loading import iter_jsonl_files, load_jsonl_dataframe, map_jsonl_files
+from catalog.common.stops import find_stop_rows, group_stop_rows, prepare_stop_numeric_columns
 from catalog.common.telemetry_prep import prepare_timestamp_column
 
 DATA_DIR = Path("data")
 OUTPUT_DIR = Path("results")
 OUTPUT_CSV = OUTPUT_DIR / "find_stops" / "hourly_stop_intervals.csv"
 STOPPED_STATES = ["STOPPED"]
+STOP_NUMERIC_COLS = ["Srpm", "Fact", "Xfrt", "Yfrt", "Zfrt"]
 MAX_GAP_SECONDS = 2
 
 
 def load_telemetry(file_path: Path) -> pd.DataFrame:
-    """Load and timestamp-normalize one telemetry JSONL file."""
+    """Load one telemetry JSONL file with parsed timestamps and float32 stop signals."""
     df = load_jsonl_dataframe(
         file_path,
         on_malformed_json=lambda msg: print(f"[WARNING] {msg}"),
     )
     if df.empty or "timestamp" not in df.columns:
         return pd.DataFrame()
-    return prepare_timestamp_column(df, time_col="timestamp", drop_invalid=True, sort=True)
+    df = prepare_timestamp_column(df, time_col="timestamp", drop_invalid=True, sort=True, format="ISO8601")
+    return prepare_stop_numeric_columns(df, STOP_NUMERIC_COLS)[0]
 
 
 def find_stops(df: pd.DataFrame) -> pd.DataFrame:
     """Identify rows likely representing machine stops."""
-    numeric_cols = ["Srpm", "Fact", "Xfrt", "Yfrt", "Zfrt"]
     stop_rows, available_cols = find_stop_rows(
         df,
         stopped_states=STOPPED_STATES,
-        numeric_cols=numeric_cols,
+        numeric_cols=STOP_NUMERIC_COLS,
         execution_col="execution",
     )
 
@@ -51,6 +52,22 @@ def group_stops(df: pd.DataFrame, max_gap_seconds: float = MAX_GAP_SECONDS) -> p
     return group_stop_rows(df, max_gap_seconds=max_gap_seconds)
 
 
+def summarize_file(file_path: Path) -> pd.DataFrame:
+    """Load one file and return its stop intervals tagged with day and hour."""
+    df = load_telemetry(file_path)
+    if df.empty:
+        return pd.DataFrame()
+
+    grouped = group_stops(find_stops(df))
+    if grouped.empty:
+        return grouped
+
+    grouped["day"] = grouped["start"].dt.date
+    grouped["hour"] = grouped["start"].dt.hour
+    grouped["source_file"] = file_path.name
+    return grouped
+
+
 def main():
     all_files = list(iter_jsonl_files(DATA_DIR, recursive=False))
     if not all_files:
@@ -60,20 +77,9 @@ def main():
     print(f"Analyzing {len(all_files)} files in {DATA_DIR}...\n")
 
     interval_frames: list[pd.DataFrame] = []
-    for file_path in all_files:
-        df = load_telemetry(file_path)
-        if df.empty:
-            continue
-
-        stops = find_stops(df)
-        grouped = group_stops(stops)
+    for file_path, grouped in zip(all_files, map_jsonl_files(summarize_file, all_files)):
         if grouped.empty:
             continue
-
-        grouped["day"] = grouped["start"].dt.date
-        grouped["hour"] = grouped["start"].dt.hour
-
-        grouped["source_file"] = file_path.name
         interval_frames.append(grouped)
         print(f"{file_path.name}: {len(grouped)} stop intervals summarized.")
 
@@ -1,7 +1,7 @@
 """
 Summarize how many distinct machines appear in telemetry data per day.
 
-This script reads the compact derived dataset in ``data/_derived/basic_metrics.csv``
+This script reads the compact derived dataset in ``data/_derived/basic_metrics.parquet``
 when available (generated during orchestration) so startup avoids re-parsing every
 JSONL payload repeatedly.
 
@@ -12,7 +12,6 @@ Outputs:
 from __future__ import annotations
 
 import sys
-from collections import defaultdict
 from pathlib import Path
 
 import pandas as pd
@@ -21,30 +20,33 @@ ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from catalog.common.basic_metrics import iter_basic_metrics_rows
+from catalog.common.basic_metrics import iter_basic_metrics_frames
 
 DATA_DIR = Path("data")
 OUTPUT_SUMMARY_CSV = "machines_active_per_day.csv"
 
 
 def main() -> None:
-    machines_by_day: defaultdict[object, set[str]] = defaultdict(set)
     parsed_rows = 0
+    day_machine_pairs: list[pd.DataFrame] = []
 
-    for timestamp, machine, _ in iter_basic_metrics_rows(DATA_DIR):
-        if machine is None:
-            continue
-        machines_by_day[timestamp.date()].add(machine)
-        parsed_rows += 1
+    # Deduplicate (date, machine) pairs per chunk so only the small distinct
+    # set is kept in memory, then deduplicate across chunks and count per day.
+    for chunk in iter_basic_metrics_frames(DATA_DIR, columns=["machine"]):
+        chunk = chunk.dropna(subset=["machine"])
+        parsed_rows += len(chunk)
+        day_machine_pairs.append(chunk[["date", "machine"]].drop_duplicates())
 
-    if not machines_by_day:
+    if parsed_rows == 0:
         raise SystemExit("No valid records with both timestamp and machine found in data folder.")
 
-    summary_rows = [
-        {"date": day, "machines_active": len(machines)}
-        for day, machines in sorted(machines_by_day.items())
-    ]
-    machines_active_per_day = pd.DataFrame(summary_rows)
+    machines_active_per_day = (
+        pd.concat(day_machine_pairs, ignore_index=True)
+        .drop_duplicates()
+        .groupby("date")
+        .size()
+        .reset_index(name="machines_active")
+    )
 
     print(f"Parsed {parsed_rows} rows for machine/day activity.")
     print("\nMachines active per day:")
@@ -3,46 +3,53 @@
 from __future__ import annotations
 
 import sys
-from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from catalog.common.basic_metrics import iter_basic_metrics_rows
+from catalog.common.basic_metrics import read_basic_metrics_frame
 
 DATA_DIR = Path("data")
 OUTPUT_SUMMARY_CSV = "missing_per_day_by_machine.csv"
 
 
 def main() -> None:
-    prev_by_machine: dict[str, int] = {}
-    missing_by_machine_day: defaultdict[tuple[str, object], int] = defaultdict(int)
-    parsed_rows = 0
-
-    for timestamp, machine, sequence in iter_basic_metrics_rows(DATA_DIR):
-        parsed_rows += 1
-        if machine is None or sequence is None:
-            continue
-
-        prev_sequence = prev_by_machine.get(machine)
-        if prev_sequence is not None:
-            gap = sequence - prev_sequence
-            if gap > 1:
-                missing_by_machine_day[(machine, timestamp.date())] += gap - 1
-        prev_by_machine[machine] = sequence
-
-    if not prev_by_machine:
+    metrics = read_basic_metrics_frame(DATA_DIR)
+    parsed_rows = len(metrics)
+    valid = metrics.dropna(subset=["machine", "sequence"])
+
+    if valid.empty:
         raise SystemExit("No valid records with timestamp+machine+sequence found in data folder.")
 
-    rows = [
-        {"machine": machine, "date": day, "missing_count": int(count)}
-        for (machine, day), count in sorted(missing_by_machine_day.items())
-    ]
-    missing_per_day_machine = pd.DataFrame(rows, columns=["machine", "date", "missing_count"])
+    # A stable sort by machine code keeps each machine's rows in file order, so
+    # one NumPy diff plus a machine-boundary mask yields per-machine gaps.
+    machine_codes, _ = pd.factorize(valid["machine"])
+    order = np.argsort(machine_codes, kind="stable")
+    codes = machine_codes[order]
+    sequences = valid["sequence"].to_numpy(dtype=np.int64)[order]
+
+    missing = np.zeros(len(order), dtype=np.int64)
+    same_machine = codes[1:] == codes[:-1]
+    missing[1:] = np.where(same_machine, np.maximum(sequences[1:] - sequences[:-1] - 1, 0), 0)
+
+    has_missing = missing > 0
+    rows = valid.iloc[order[has_missing]]
+    missing_per_day_machine = (
+        pd.DataFrame(
+            {
+                "machine": rows["machine"].to_numpy(),
+                "date": rows["date"].to_numpy(),
+                "missing_count": missing[has_missing],
+            }
+        )
+        .groupby(["machine", "date"], as_index=False)["missing_count"]
+        .sum()
+    )
 
     print(f"Parsed {parsed_rows} rows.")
     print("\nMissing sequence numbers per day per machine:")
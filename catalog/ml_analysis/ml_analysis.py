@@ -1,21 +1,26 @@
 """Train baseline per-machine models for future-stop exploration.
 
 This manual deep/exploratory script builds lag features from telemetry, trains
-one RandomForest classifier per machine, and writes model/evaluation artifacts
+one histogram gradient-boosting classifier per machine, and writes model/evaluation artifacts
 under ``ml_results/``. Labels and evaluation are heuristic; outputs are not a
 validated production predictor.
 """
 
-import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from pathlib import Path
 
 import joblib
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
+import pyarrow as pa
+import pyarrow.json as pa_json
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.inspection import permutation_importance
 from sklearn.metrics import classification_report, confusion_matrix
-from sklearn.model_selection import train_test_split
+from threadpoolctl import threadpool_limits
 
+from catalog.common.data_loading import iter_jsonl_records
 from catalog.common.telemetry_prep import prepare_timestamp_column, to_numeric
 
 # Directory containing input JSONL telemetry files.
@@ -24,7 +29,7 @@ DATA_DIR = Path("data")
 # Output directory for trained models and evaluation artifacts.
 OUTPUT_DIR = Path("ml_results")
 
-# Whether to save the trained RandomForest model to disk.
+# Whether to save the trained classifier to disk.
 SAVE_MODEL = True
 
 # Lag steps (in resampled rows) used to construct lagged telemetry features.
@@ -35,9 +40,71 @@ LAG_STEPS = [1, 5, 10]
 # resampling rate is fixed and stable.
 FUTURE_WINDOW = 60
 
+# Fraction of each machine's rows, taken from the end of its timeline, held
+# out for evaluation.
+TEST_FRACTION = 0.2
+
 # Resampling frequency in Hz. A value of 1 means 1-second bins.
 DOWNSAMPLE_HZ = 1
 
+# Telemetry signals considered as model features when present.
+CANDIDATE_FEATURES = [
+    "Srpm",
+    "S2rpm",
+    "Fact",
+    "Xload",
+    "Yload",
+    "Zload",
+    "Sload",
+    "Fovr",
+    "Sovr",
+    "Frapidovr",
+    "auto_time",
+    "cut_time",
+]
+
+# Arrow JSON parse options: keep timestamps as text so they are parsed with the
+# same ISO8601 rules as the other scripts; infer every other column.
+ARROW_PARSE_OPTIONS = pa_json.ParseOptions(
+    explicit_schema=pa.schema([("timestamp", pa.string())]),
+    unexpected_field_behavior="infer",
+)
+
+
+def _load_jsonl_columns(path):
+    """
+    Load one JSONL file record by record into a dict of per-column lists.
+
+    Used when Arrow rejects a file (malformed lines, or a column mixing numbers
+    with strings such as ``UNAVAILABLE``). Keys first seen mid-stream are
+    back-filled with None.
+    """
+    columns = {}
+    row_count = 0
+    for record in iter_jsonl_records(path):
+        for key in record:
+            if key not in columns:
+                columns[key] = [None] * row_count
+        for key, values in columns.items():
+            values.append(record.get(key))
+        row_count += 1
+    return pd.DataFrame(columns)
+
+
+def _load_jsonl_file(path):
+    """
+    Load one JSONL file with Arrow's columnar C++ reader.
+
+    The Arrow table is handed to pandas with ``split_blocks=True`` and
+    ``self_destruct=True`` so numeric columns are not copied into consolidated
+    blocks and Arrow buffers are released as they are converted.
+    """
+    try:
+        table = pa_json.read_json(str(path), parse_options=ARROW_PARSE_OPTIONS)
+    except pa.ArrowInvalid:
+        return _load_jsonl_columns(path)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
 
 def load_all_data(data_dir):
     """
@@ -60,24 +127,16 @@ def load_all_data(data_dir):
 
     Notes
     -----
-    Malformed JSON lines are skipped. The combined dataset is sorted by time
-    before indexing.
+    Files are parsed by Arrow's multithreaded JSON reader; files it rejects
+    fall back to the tolerant line-by-line loader, which skips malformed JSON
+    lines. The combined dataset is sorted by time before indexing.
     """
-    records = []
-
-    for f in sorted(data_dir.glob("*.jsonl")):
-        with open(f, "r") as fh:
-            for line in fh:
-                try:
-                    records.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-
-    df = pd.DataFrame(records)
+    frames = [_load_jsonl_file(f) for f in sorted(data_dir.glob("*.jsonl"))]
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     if "timestamp" not in df.columns:
         raise ValueError("timestamp column missing")
 
-    df = prepare_timestamp_column(df, time_col="timestamp", drop_invalid=True, sort=True)
+    df = prepare_timestamp_column(df, time_col="timestamp", drop_invalid=True, sort=True, format="ISO8601")
     df = df.set_index("timestamp")
     return df
 
@@ -100,10 +159,11 @@ def preprocess(df):
 
     Returns
     -------
-    tuple[pandas.DataFrame, list[str]]
-        ``(processed_df, numeric_features)`` where:
+    tuple[pandas.DataFrame, list[str], list[str]]
+        ``(processed_df, numeric_features, lag_feature_names)`` where:
         - ``processed_df`` contains lagged features and the target label
         - ``numeric_features`` lists the base telemetry signals that were used
+        - ``lag_feature_names`` lists the lagged model inputs in column order
 
     Raises
     ------
@@ -113,74 +173,96 @@ def preprocess(df):
     Notes
     -----
     The target label ``future_stop`` is derived heuristically:
-    - if ``execution`` exists, rows where execution is STOPPED or READY are
-      treated as stopped
-    - otherwise, the first available spindle-speed column is used as a fallback
+    - rows where the first available spindle-speed column is 0 are treated
+      as stopped
+    - the recorder's text ``execution`` state is not carried through the
+      numeric resample, so it does not take part in the label
 
     This label is shifted by ``FUTURE_WINDOW`` rows, so the prediction horizon
     depends on the resampling frequency.
     """
-    df = df.resample(f"{int(1 / DOWNSAMPLE_HZ)}s").mean(numeric_only=True)
+    # Only the candidate features are used below, so resample just those
+    # instead of every recorded signal. The numeric mean drops the text
+    # ``execution`` column, so the label comes from spindle speed.
+    used_columns = [c for c in CANDIDATE_FEATURES if c in df.columns]
+    df = df[used_columns].resample(f"{int(1 / DOWNSAMPLE_HZ)}s").mean(numeric_only=True)
     df = df.ffill().fillna(0)
 
-    candidate_features = [
-        "Srpm",
-        "S2rpm",
-        "Fact",
-        "Xload",
-        "Yload",
-        "Zload",
-        "Sload",
-        "Fovr",
-        "Sovr",
-        "Frapidovr",
-        "auto_time",
-        "cut_time",
-    ]
-    numeric_features = [c for c in candidate_features if c in df.columns]
+    numeric_features = [c for c in CANDIDATE_FEATURES if c in df.columns]
     if not numeric_features:
         raise ValueError("No numeric telemetry features found in this dataset.")
 
-    for col in numeric_features:
-        df[col] = to_numeric(df[col]).fillna(0)
-
-    # Create lagged features so the model can use recent history.
-    for col in numeric_features:
-        for lag in LAG_STEPS:
-            df[f"{col}_lag{lag}"] = df[col].shift(lag)
+    # Tree splits are threshold comparisons, so float32 is sufficient. The
+    # resampled features are already gap-filled above, so no NaN reaches the model.
+    df[numeric_features] = df[numeric_features].apply(to_numeric).astype(np.float32)
+
+    # Create lagged features so the model can use recent history: one shift of
+    # the whole numeric block per lag, joined to ``df`` in a single concat
+    # instead of inserting every lag column separately.
+    numeric_block = df[numeric_features]
+    lagged = pd.concat(
+        [numeric_block.shift(lag).add_suffix(f"_lag{lag}") for lag in LAG_STEPS],
+        axis=1,
+    )
+    lag_feature_names = [f"{col}_lag{lag}" for col in numeric_features for lag in LAG_STEPS]
+    df = pd.concat([df, lagged[lag_feature_names]], axis=1)
 
-    if "execution" in df.columns:
-        df["is_stopped"] = df["execution"].isin(["STOPPED", "READY"]).astype(int)
+    spindle_cols = [c for c in ["Srpm", "S2rpm"] if c in df.columns]
+    if spindle_cols:
+        df["is_stopped"] = (df[spindle_cols[0]] == 0).astype(int)
     else:
-        spindle_cols = [c for c in ["Srpm", "S2rpm"] if c in df.columns]
-        if spindle_cols:
-            df["is_stopped"] = (df[spindle_cols[0]] == 0).astype(int)
-        else:
-            print("Warning: no execution or spindle speed data; assuming no stops.")
-            df["is_stopped"] = 0
+        print("Warning: no spindle speed data; assuming no stops.")
+        df["is_stopped"] = 0
 
     df["future_stop"] = df["is_stopped"].shift(-FUTURE_WINDOW)
 
     # Drop context columns and rows that cannot support lagged prediction.
-    df = df.drop(columns=["is_stopped", "execution", "mode"], errors="ignore")
+    df = df.drop(columns=["is_stopped"])
     lag_cols = [f"{numeric_features[0]}_lag{max(LAG_STEPS)}"]
     df = df.dropna(subset=lag_cols + ["future_stop"])
+    df["future_stop"] = df["future_stop"].astype(np.int8)
+
+    return df, numeric_features, lag_feature_names
+
 
-    return df, numeric_features
+def chronological_split(X, y, test_fraction=TEST_FRACTION):
+    """
+    Split time-ordered features and labels into leading train and trailing test rows.
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        Model inputs in time order.
+    y : pandas.Series
+        Labels aligned with ``X``.
+    test_fraction : float, default=TEST_FRACTION
+        Fraction of rows, taken from the end, held out for evaluation.
+
+    Returns
+    -------
+    tuple[pandas.DataFrame, pandas.DataFrame, pandas.Series, pandas.Series]
+        ``(X_train, X_test, y_train, y_test)`` as positional slices, so no row
+        of the test split precedes a row of the training split.
+    """
+    split = int(len(X) * (1 - test_fraction))
+    return X.iloc[:split], X.iloc[split:], y.iloc[:split], y.iloc[split:]
 
 
-def train_model(df, numeric_features, machine_name):
+def train_model(df, lag_feature_names, machine_name, n_jobs=-1):
     """
-    Train and evaluate one RandomForest stop-prediction model for a machine.
+    Train and evaluate one gradient-boosting stop-prediction model for a machine.
 
     Parameters
     ----------
     df : pandas.DataFrame
         Preprocessed machine data containing lagged features and ``future_stop``.
-    numeric_features : list[str]
-        Base telemetry feature names used to identify lagged feature columns.
+    lag_feature_names : list[str]
+        Lagged feature columns built by :func:`preprocess`, used as model inputs.
     machine_name : str
         Machine identifier used for output naming.
+    n_jobs : int, default=-1
+        OpenMP threads for boosting; -1 leaves the default. Use 1 when models
+        for several machines are already trained in parallel processes.
 
     Returns
     -------
@@ -190,40 +272,46 @@ def train_model(df, numeric_features, machine_name):
 
     Notes
     -----
-    The train/test split is random and stratified. This is suitable for a simple
-    baseline, but it does not preserve temporal ordering and may therefore
-    overestimate performance for time-series prediction tasks.
+    The train/test split is chronological: the last ``TEST_FRACTION`` of the
+    rows is held out. Lagged features and the future-stop label overlap
+    neighbouring rows, so a random split would leak test information into
+    training and overestimate performance.
+
+    Feature importance is permutation importance on the test split, since
+    histogram gradient boosting has no impurity-based ``feature_importances_``.
     """
-    X = df[[c for c in df.columns if c.startswith(tuple(numeric_features)) and "lag" in c]]
-    y = df["future_stop"].astype(int)
+    X = df[lag_feature_names]
+    y = df["future_stop"]
 
     # Skip training if the target contains only one class.
     if y.nunique() < 2:
         print(f"Skipping {machine_name}: only one class present.")
         return None
 
-    X_train, X_test, y_train, y_test = train_test_split(
-        X,
-        y,
-        test_size=0.2,
-        random_state=42,
-        stratify=y,
-    )
+    X_train, X_test, y_train, y_test = chronological_split(X, y)
+    if y_train.nunique() < 2 or y_test.nunique() < 2:
+        print(f"Skipping {machine_name}: chronological split leaves one class in train or test.")
+        return None
 
-    model = RandomForestClassifier(
-        n_estimators=200,
-        n_jobs=-1,
-        random_state=42,
+    model = HistGradientBoostingClassifier(
+        max_iter=300,
+        learning_rate=0.05,
+        max_bins=255,
+        early_stopping=True,
+        validation_fraction=0.1,
         class_weight="balanced",
+        random_state=42,
     )
-    model.fit(X_train, y_train)
-    y_pred = model.predict(X_test)
+    with threadpool_limits(limits=None if n_jobs == -1 else n_jobs, user_api="openmp"):
+        model.fit(X_train, y_train)
+        y_pred = model.predict(X_test)
+        importance = permutation_importance(model, X_test, y_test, n_repeats=5, random_state=42)
 
     report = classification_report(y_test, y_pred, digits=3, output_dict=True)
     print(f"\n=== {machine_name} ===")
     print(classification_report(y_test, y_pred, digits=3))
 
-    imp = pd.Series(model.feature_importances_, index=X.columns).sort_values(ascending=False)
+    imp = pd.Series(importance.importances_mean, index=X.columns).sort_values(ascending=False)
     out_dir = OUTPUT_DIR / machine_name
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -247,9 +335,83 @@ def train_model(df, numeric_features, machine_name):
     }
 
 
+def process_machine(machine_name, mdf, n_jobs=-1):
+    """
+    Preprocess one machine's telemetry and train its model.
+
+    This is a module-level function so it can run in a worker process.
+
+    Parameters
+    ----------
+    machine_name : str
+        Machine identifier.
+    mdf : pandas.DataFrame
+        That machine's telemetry, indexed by timestamp.
+    n_jobs : int, default=-1
+        Passed to :func:`train_model`.
+
+    Returns
+    -------
+    dict | None
+        Summary metrics, or None if training was skipped or failed.
+    """
+    print(f"\n--- Analyzing {machine_name} ---")
+    try:
+        processed, _, lag_cols = preprocess(mdf)
+        return train_model(processed, lag_cols, machine_name, n_jobs=n_jobs)
+    except Exception as e:
+        print(f"Error processing {machine_name}: {e}")
+        return None
+
+
+def process_machines(df, max_workers=None):
+    """
+    Run :func:`process_machine` for every machine in ``df``.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Combined telemetry with a ``machine`` column.
+    max_workers : int, optional
+        Upper bound on worker processes; defaults to the CPU count.
+
+    Returns
+    -------
+    list[dict | None]
+        One result per machine, in sorted machine-name order.
+    """
+    # Row positions per machine; each machine's frame is sliced out with
+    # ``take`` only when it is processed instead of copying every group up front.
+    machine_rows = df.groupby("machine", sort=False).indices
+    machine_names = sorted(machine_rows)
+    workers = min(len(machine_names), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        results = [process_machine(name, df.take(machine_rows[name])) for name in machine_names]
+    else:
+        # Keep at most ``workers`` slices in flight: the next machine is only
+        # sliced and submitted once a running one has finished.
+        results = [None] * len(machine_names)
+        pending = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for position, name in enumerate(machine_names):
+                if len(pending) >= workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[pending.pop(future)] = future.result()
+                future = executor.submit(process_machine, name, df.take(machine_rows[name]), 1)
+                pending[future] = position
+            for future in as_completed(pending):
+                results[pending[future]] = future.result()
+    return results
+
+
 def main():
     """
     Run the full per-machine stop-prediction pipeline.
+
+    Machines are independent, so with more than one machine and CPU each model
+    is trained in its own process limited to a single thread. This scales
+    better than training machines one after another with ``n_jobs=-1``.
     """
     print("Loading data...")
     df = load_all_data(DATA_DIR)
@@ -257,17 +419,7 @@ def main():
     if "machine" not in df.columns:
         raise ValueError("Missing 'machine' column – cannot separate by machine.")
 
-    machine_stats = []
-
-    for machine_name, mdf in df.groupby("machine"):
-        print(f"\n--- Analyzing {machine_name} ---")
-        try:
-            processed, feats = preprocess(mdf)
-            stats = train_model(processed, feats, machine_name)
-            if stats:
-                machine_stats.append(stats)
-        except Exception as e:
-            print(f"Error processing {machine_name}: {e}")
+    machine_stats = [stats for stats in process_machines(df) if stats]
 
     if machine_stats:
         summary = pd.DataFrame(machine_stats)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from catalog.ml_analysis import ml_analysis
+
+
+def test_chronological_split_keeps_test_rows_after_training_rows() -> None:
+    index = pd.date_range("2026-03-23T08:00:00", periods=50, freq="1s")
+    X = pd.DataFrame({"Srpm_lag1": range(50)}, index=index)
+    y = pd.Series([0, 1] * 25, index=index)
+
+    X_train, X_test, y_train, y_test = ml_analysis.chronological_split(X, y)
+
+    assert (len(X_train), len(X_test)) == (40, 10)
+    assert X_train.index.max() < X_test.index.min()
+    assert y_train.index.equals(X_train.index)
+    assert y_test.index.equals(X_test.index)
+
+
+def test_process_machines_bounds_in_flight_work_and_keeps_order(monkeypatch) -> None:
+    names = ["m4", "m1", "m3", "m0", "m2"]
+    df = pd.DataFrame({"machine": [name for name in names for _ in range(int(name[1]) + 1)]})
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_process_machine(machine_name, mdf, n_jobs=-1):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Later machines finish first so completion order differs from submission order.
+        time.sleep(0.05 * (5 - int(machine_name[1])))
+        with lock:
+            in_flight -= 1
+        return {"machine": machine_name, "rows": len(mdf), "n_jobs": n_jobs}
+
+    # A wide thread pool starts every submitted task at once, so only
+    # process_machines itself can keep the number of running tasks down.
+    monkeypatch.setattr(ml_analysis, "ProcessPoolExecutor", lambda max_workers: ThreadPoolExecutor(8))
+    monkeypatch.setattr(ml_analysis, "process_machine", fake_process_machine)
+
+    results = ml_analysis.process_machines(df, max_workers=2)
+
+    assert results == [{"machine": f"m{i}", "rows": i + 1, "n_jobs": 1} for i in range(5)]
+    assert peak == 2
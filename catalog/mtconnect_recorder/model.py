@@ -268,12 +268,19 @@ def _find_first(root: ET.Element, local_name: str) -> ET.Element | None:
     return next((element for element in root.iter() if _local_name(element.tag) == local_name), None)
 
 
+# First characters int()/float() can accept: signs, digits, a leading decimal
+# point, and nan/inf spellings. Anything else is returned as text directly.
+_NUMBER_START = frozenset("+-.0123456789nNiI")
+
+
 def _try_number(value: str | None) -> Any:
     if value is None:
         return None
     stripped = value.strip()
     if stripped == "":
         return ""
+    if stripped[0] not in _NUMBER_START and not stripped[0].isdecimal():
+        return stripped
     try:
         return int(stripped)
     except ValueError:
@@ -46,8 +46,23 @@ def machine_display_name(
     return name or identity or fallback
 
 
+def root_local_name(xml_text: str) -> str:
+    """Return the document element name without building the whole tree."""
+
+    parser = ET.XMLPullParser(events=("start",))
+    for offset in range(0, len(xml_text), 4096):
+        parser.feed(xml_text[offset : offset + 4096])
+        for _event, element in parser.read_events():
+            return _local_name(element.tag)
+    parser.close()
+    raise ET.ParseError("MTConnect document has no root element.")
+
+
 def parse_stream_header(xml_text: str) -> StreamHeader:
-    root = ET.fromstring(xml_text)
+    return _parse_stream_header_root(ET.fromstring(xml_text))
+
+
+def _parse_stream_header_root(root: ET.Element) -> StreamHeader:
     if _local_name(root.tag) == "MTConnectError":
         error = _find_first(root, "Error")
         code = error.attrib.get("errorCode", "UNKNOWN") if error is not None else "UNKNOWN"
@@ -81,7 +96,7 @@ def parse_probe(xml_text: str) -> ProbeModel:
     digest = sha256(raw).hexdigest()
     root = ET.fromstring(xml_text)
     if _local_name(root.tag) == "MTConnectError":
-        parse_stream_header(xml_text)
+        _parse_stream_header_root(root)
 
     devices: dict[str, dict[str, Any]] = {}
     data_items: dict[str, dict[str, Any]] = {}
@@ -207,8 +222,8 @@ def parse_streams(
     probe: ProbeModel | None,
     received_at: str | None = None,
 ) -> ParsedBatch:
-    header = parse_stream_header(xml_text)
     root = ET.fromstring(xml_text)
+    header = _parse_stream_header_root(root)
     received = received_at or _utc_now()
     observations: list[dict[str, Any]] = []
     sequences: list[int] = []
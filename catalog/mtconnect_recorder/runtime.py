@@ -13,7 +13,6 @@ from dataclasses import replace
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
-from xml.etree import ElementTree as ET
 
 import requests
 
@@ -25,7 +24,6 @@ from .model import (
     _bool_from_env,
     _float_from_env,
     _int_from_env,
-    _local_name,
     _parse_sources_text,
     _read_json,
     _sources_from_environment,
@@ -38,6 +36,7 @@ from .parsing import (
     parse_stream_header,
     parse_streams,
     plan_sequence,
+    root_local_name,
     validate_batch_continuity,
 )
 from .storage import DurableRecorderStore
@@ -59,7 +58,7 @@ class MtconnectClient:
         body = response.text.strip()
         if not body:
             raise MtconnectProtocolError(f"MTConnect /{endpoint} returned an empty body.")
-        if _local_name(ET.fromstring(body).tag) == "MTConnectError":
+        if root_local_name(body) == "MTConnectError":
             parse_stream_header(body)
         return body
 
@@ -148,6 +147,7 @@ class RecorderRuntime:
         self.checkpoints: dict[str, SourceCheckpoint] = {}
         self.probes: dict[str, ProbeModel] = {}
         self.source_status: dict[str, dict[str, Any]] = {}
+        self.clients: dict[str, tuple[str, MtconnectClient]] = {}
         self.next_attempt_at: dict[str, float] = {}
         self.backoff: dict[str, float] = {}
         self.enabled = not MANAGED_MODE
@@ -486,9 +486,19 @@ class RecorderRuntime:
                 batch.last_observation_sequence,
             )
 
+    def _client(self, source_name: str, base_url: str) -> MtconnectClient:
+        """Return the source's client, keeping its HTTP connection alive across polls."""
+
+        with self.lock:
+            cached = self.clients.get(source_name)
+            if cached is None or cached[0] != base_url:
+                cached = (base_url, MtconnectClient(base_url, timeout=REQUEST_TIMEOUT))
+                self.clients[source_name] = cached
+            return cached[1]
+
     def capture_source(self, source_name: str, base_url: str) -> tuple[str, bool, str]:
         try:
-            client = MtconnectClient(base_url, timeout=REQUEST_TIMEOUT)
+            client = self._client(source_name, base_url)
             current_xml = client.fetch_current()
             current_header = parse_stream_header(current_xml)
             checkpoint = self.checkpoints.get(source_name)
@@ -12,7 +12,7 @@ ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from catalog.common.basic_metrics import iter_basic_metrics_rows
+from catalog.common.basic_metrics import iter_basic_metrics_frames
 
 DATA_DIR = Path("data")
 OUTPUT_CSV = "sampling_rate_summary.csv"
@@ -25,21 +25,23 @@ def main() -> None:
     daily_rate_count: defaultdict[object, int] = defaultdict(int)
     parsed_rows = 0
 
-    for timestamp, _, _ in iter_basic_metrics_rows(DATA_DIR):
-        parsed_rows += 1
-        if prev_timestamp is None:
-            prev_timestamp = timestamp
+    for frame in iter_basic_metrics_frames(DATA_DIR, ["timestamp"]):
+        if frame.empty:
             continue
-
-        gap_seconds = (timestamp - prev_timestamp).total_seconds()
-        prev_timestamp = timestamp
-        if gap_seconds <= 0:
-            continue
-
-        sample_rate = 1 / gap_seconds
-        day = timestamp.date()
-        daily_rate_sum[day] += sample_rate
-        daily_rate_count[day] += 1
+        parsed_rows += len(frame)
+
+        timestamps = frame["timestamp"]
+        gap_seconds = timestamps.diff().dt.total_seconds().to_numpy(copy=True)
+        if prev_timestamp is not None:
+            gap_seconds[0] = (timestamps.iloc[0] - prev_timestamp).total_seconds()
+        prev_timestamp = timestamps.iloc[-1]
+
+        valid = gap_seconds > 0
+        sample_rate = pd.Series(1 / gap_seconds[valid])
+        per_day = sample_rate.groupby(frame["date"].to_numpy()[valid]).agg(["sum", "count"])
+        for day, rate_sum, rate_count in per_day.itertuples():
+            daily_rate_sum[day] += rate_sum
+            daily_rate_count[day] += int(rate_count)
 
     if not daily_rate_count:
         raise SystemExit("No valid records found.")
@@ -119,6 +119,21 @@ def test_sample_parsing_preserves_every_observation_and_condition_attributes(tmp
     assert condition["attributes"]["qualifier"] == "HIGH"
 
 
+def test_error_documents_are_detected_from_the_root_element(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    error_xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<MTConnectError xmlns="urn:mtconnect.org:MTConnectError:1.7">'
+        '<Header instanceId="77" bufferSize="4096"/>'
+        '<Errors><Error errorCode="OUT_OF_RANGE">from is too old</Error></Errors>'
+        "</MTConnectError>"
+    )
+    assert recorder.root_local_name(SAMPLE_XML) == "MTConnectStreams"
+    assert recorder.root_local_name(error_xml) == "MTConnectError"
+    with pytest.raises(recorder.MtconnectProtocolError, match="OUT_OF_RANGE: from is too old"):
+        recorder.parse_streams(error_xml, source_name="Mazak", probe=None)
+
+
 def test_machine_id_falls_back_to_probe_serial_then_device_id(tmp_path, monkeypatch):
     recorder = load_recorder(tmp_path, monkeypatch)
     probe_without_uuid = PROBE_XML.replace(' uuid="MAZAK-001"', "")
@@ -380,3 +395,43 @@ def test_orphaned_raw_batch_is_recovered_before_checkpoint_advances(tmp_path, mo
     assert normalized.exists()
     assert len(observation_path.read_text().splitlines()) == 3
     assert len(normalized.read_text().splitlines()) == 3
+
+
+def test_observation_values_convert_numbers_and_keep_status_text(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    values = {
+        "v1": " 42 ",
+        "v2": "-1.5",
+        "v3": ".5",
+        "v4": " ACTIVE ",
+        "v5": "UNAVAILABLE",
+        "v6": "1x",
+        "v7": "  ",
+    }
+    events = "".join(
+        f'<Message dataItemId="{item_id}" sequence="{sequence}" '
+        f'timestamp="2026-07-28T07:34:58.000Z">{text}</Message>'
+        for sequence, (item_id, text) in enumerate(values.items(), start=10)
+    )
+    xml_text = SAMPLE_XML.replace(
+        '<Header creationTime="2026-07-28T07:35:00Z" sender="agent" instanceId="77" '
+        'bufferSize="4096" firstSequence="10" lastSequence="12" nextSequence="13"/>',
+        '<Header creationTime="2026-07-28T07:35:00Z" sender="agent" instanceId="77" '
+        'bufferSize="4096" firstSequence="10" lastSequence="16" nextSequence="17"/>',
+    ).replace(
+        '<ComponentStream component="Linear" componentId="x" name="X">',
+        '<ComponentStream component="Controller" componentId="c" name="C">'
+        f"<Events>{events}</Events></ComponentStream>"
+        '<ComponentStream component="Linear" componentId="x" name="X">',
+    )
+
+    batch = recorder.parse_streams(xml_text, source_name="Mazak", probe=None)
+    parsed = {record["data_item_id"]: record["value"] for record in batch.observations}
+
+    assert parsed["v1"] == 42
+    assert parsed["v2"] == -1.5
+    assert parsed["v3"] == 0.5
+    assert parsed["v4"] == "ACTIVE"
+    assert parsed["v5"] == "UNAVAILABLE"
+    assert parsed["v6"] == "1x"
+    assert parsed["v7"] == ""
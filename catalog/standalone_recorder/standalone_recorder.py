@@ -8,7 +8,7 @@ intervals.
 
 Pipeline
 --------
-1. Poll each configured MTConnect ``/current`` endpoint at a fixed interval
+1. Poll all configured MTConnect ``/current`` endpoints concurrently at a fixed interval
 2. Parse XML into a flat dictionary of values
 3. Keep only snapshots whose MTConnect sequence number has changed
 4. Add local timestamp and machine name
@@ -26,7 +26,8 @@ This is a lightweight recorder intended for practical data capture, not a
 fault-tolerant ingestion service. In particular:
 
 - buffering is in-memory only until flushed
-- no locking is used around the shared buffer
+- no locking is used around the shared buffer; it is a ``deque`` whose
+  ``append``/``popleft`` calls are individually thread-safe
 - duplicate suppression is based on MTConnect ``lastSequence`` only
 - local wall-clock time is recorded, not source-provided event time
 
@@ -38,12 +39,20 @@ local editing.
 
 import json
 import os
+import re
 import time
 import xml.etree.ElementTree as ET
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from threading import Event, Thread
 
-import requests
+import urllib3
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # MTConnect sources to poll.
 # Keys are machine names recorded in the output JSONL rows.
@@ -60,19 +69,63 @@ DATA_DIR = "data"
 # 0.2 seconds corresponds to 5 Hz polling.
 POLL_INTERVAL = 0.2
 
+# Per-request HTTP timeout in seconds.
+REQUEST_TIMEOUT = 1
+
 # Flush buffered rows to disk every 1 second.
 FLUSH_INTERVAL = 1.0
 
+# Retry delay in seconds after a failed fetch, doubled on each consecutive
+# failure of the same source up to BACKOFF_MAX.
+BACKOFF_INITIAL = 1.0
+BACKOFF_MAX = 30.0
+
 # Shared in-memory buffer of newly observed records awaiting disk flush.
-buffer = []
+# The fetch thread appends on the right; the flush thread pops on the left.
+buffer = deque()
 
 # Tracks the last seen MTConnect sequence number per machine so repeated
 # snapshots can be skipped.
 last_sequence = {}
 
+# Per-source retry scheduling: current backoff delay and the monotonic time
+# before which a failing source is not polled again.
+per_source_backoff = {name: BACKOFF_INITIAL for name in SOURCES}
+next_allowed = {name: 0.0 for name in SOURCES}
+
+# Output directories already created by this process, as absolute paths.
+created_dirs = set()
+
+# Append handles for daily output files, keyed by full file path and stored
+# with their ``YYYY-MM-DD`` day. Kept open across flushes and closed once
+# their day has passed.
+open_files = {}
+
 # Global shutdown signal for both worker threads.
 stop_event = Event()
 
+# One worker per source so a slow endpoint does not delay the others.
+fetch_pool = ThreadPoolExecutor(max_workers=len(SOURCES), thread_name_prefix="fetch")
+
+# Shared keep-alive connection pools, one per source host. Failed requests are
+# not retried (the next tick polls again) but redirects are still followed,
+# as with requests.get.
+http = urllib3.PoolManager(
+    num_pools=len(SOURCES),
+    maxsize=2,
+    retries=urllib3.Retry(total=3, connect=0, read=0, status=0, other=0, redirect=3),
+)
+
+# Strips the ``{namespace}`` prefix ElementTree puts on every tag.
+NAMESPACE_PREFIX = re.compile(r"^\{[^}]*\}")
+
+# First characters that int()/float() can accept after leading whitespace:
+# signs, digits, a leading decimal point, and nan/inf spellings.
+NUMBER_START = frozenset("+-.0123456789nNiI")
+
+# Stream sections whose direct children are recorded as values.
+VALUE_SECTIONS = ("Samples", "Events")
+
 
 def try_number(val):
     """
@@ -91,8 +144,15 @@ def try_number(val):
     Notes
     -----
     This is a permissive convenience conversion used during extraction. It does
-    not attempt strict schema-aware typing.
+    not attempt strict schema-aware typing. Strings whose first non-blank
+    character cannot start a number (e.g. ``ACTIVE``, ``UNAVAILABLE``) are
+    returned without attempting a conversion, which avoids raising two
+    exceptions per text value.
     """
+    if isinstance(val, str):
+        text = val.lstrip()
+        if not text or (text[0] not in NUMBER_START and not text[0].isdecimal()):
+            return val
     try:
         return int(val)
     except ValueError:
@@ -102,13 +162,87 @@ def try_number(val):
             return val
 
 
-def extract_mtconnect_values(xml_text: str, include_condition: bool = False) -> dict:
+class MTConnectTarget:
+    """
+    ElementTree parser target that flattens MTConnect XML while it is read.
+
+    Parameters
+    ----------
+    include_condition : bool, default=False
+        If True, also record Condition elements by their status tag name.
+
+    Notes
+    -----
+    The parser calls ``start``/``data``/``end`` directly, so no Element
+    objects are created. Only direct children of the recorded sections are
+    kept; their text is the text before any nested element, as with
+    ``Element.text``.
+    """
+
+    def __init__(self, include_condition=False):
+        self.sections = VALUE_SECTIONS + ("Condition",) if include_condition else VALUE_SECTIONS
+        self.out = {}
+        # Section being read and how deep the parser is below it
+        # (1 = a direct child observation).
+        self._section = None
+        self._depth = 0
+        self._key = None
+        self._text = None
+        self._collecting = False
+
+    def start(self, tag, attrib):
+        if self._section is None:
+            local = NAMESPACE_PREFIX.sub("", tag)
+            if local in self.sections:
+                self._section = local
+                self._depth = 0
+            elif local == "Header" and "lastSequence" in attrib:
+                # MTConnect Header contains the global sequence marker used
+                # here for duplicate suppression.
+                self.out["sequence"] = int(attrib["lastSequence"])
+            return
+
+        self._depth += 1
+        if self._depth == 1:
+            self._key = attrib.get("name") or attrib.get("dataItemId") or tag
+            self._text = None
+            self._collecting = True
+        else:
+            self._collecting = False
+
+    def data(self, data):
+        if self._collecting:
+            self._text = data if self._text is None else self._text + data
+
+    def end(self, tag):
+        if self._section is None:
+            return
+        if self._depth == 0:
+            self._section = None
+            return
+
+        if self._depth == 1:
+            if self._section == "Condition":
+                # Condition elements record their status tag name
+                # (e.g. Normal, Unavailable, Fault) as the value.
+                self.out[self._key] = NAMESPACE_PREFIX.sub("", tag)
+            else:
+                text = self._text
+                self.out[self._key] = try_number(text) if text is not None else None
+            self._collecting = False
+        self._depth -= 1
+
+    def close(self):
+        return self.out
+
+
+def extract_mtconnect_values(xml_text: str | bytes, include_condition: bool = False) -> dict:
     """
     Extract a flat dictionary of values from MTConnect XML.
 
     Parameters
     ----------
-    xml_text : str
+    xml_text : str | bytes
         Raw MTConnect XML response body.
     include_condition : bool, default=False
         If True, also extract Condition elements and record their status tags.
@@ -131,39 +265,96 @@ def extract_mtconnect_values(xml_text: str, include_condition: bool = False) ->
 
     Notes
     -----
-    This function flattens XML into a simple dictionary for recording. It does
-    not preserve full MTConnect structure or namespace information.
+    The document is fed to an ``MTConnectTarget`` parser target in a single
+    pass, so no DOM tree is built per poll. This function flattens XML into a
+    simple dictionary for recording. It does not preserve full MTConnect
+    structure or namespace information.
+
+    A malformed or truncated body yields an empty dictionary, never the
+    values read before the error: a partial snapshot would carry the Header
+    sequence and suppress the complete snapshot on the next poll.
     """
-    out = {}
     try:
-        root = ET.fromstring(xml_text)
-        ns = {"m": root.tag.split("}")[0].strip("{")}
-
-        # MTConnect Header contains the global sequence marker used here for
-        # duplicate suppression.
-        header = root.find(".//m:Header", ns)
-        if header is not None and "lastSequence" in header.attrib:
-            out["sequence"] = int(header.attrib["lastSequence"])
-
-        # Extract values from Samples and Events.
-        for section in ["Samples", "Events"]:
-            for el in root.findall(f".//m:{section}/*", ns):
-                key = el.attrib.get("name") or el.attrib.get("dataItemId") or el.tag
-                text = el.text
-                out[key] = try_number(text) if text is not None else None
-
-        # Optionally include Condition elements using their status tag names
-        # (e.g. Normal, Unavailable, Fault) as the recorded value.
-        if include_condition:
-            for el in root.findall(".//m:Condition/*", ns):
-                key = el.attrib.get("name") or el.attrib.get("dataItemId") or el.tag
-                status = el.tag.split("}")[-1]
-                out[key] = status
-
+        parser = ET.XMLParser(target=MTConnectTarget(include_condition=include_condition))
+        parser.feed(xml_text)
+        return parser.close()
     except Exception as e:
         print(f"[Extractor] parse error: {e}")
 
-    return out
+    return {}
+
+
+def fetch_source(url):
+    """
+    Fetch one MTConnect source and extract its values.
+
+    Parameters
+    ----------
+    url : str
+        MTConnect ``/current`` endpoint.
+
+    Returns
+    -------
+    dict | None
+        Extracted values, or None when the response body is empty.
+    """
+    r = http.request("GET", url, timeout=REQUEST_TIMEOUT)
+    if r.status >= 400:
+        raise RuntimeError(f"HTTP {r.status} from {url}")
+    body = r.data
+    if not body.strip():
+        return None
+    return extract_mtconnect_values(body, include_condition=False)
+
+
+def poll_sources(now):
+    """
+    Run one polling tick over all sources that are not backing off.
+
+    Parameters
+    ----------
+    now : float
+        ``time.monotonic()`` value at the start of the tick. Sources whose
+        ``next_allowed`` time is later are skipped; a failing source is next
+        allowed ``now`` plus its current backoff delay.
+
+    Behavior
+    --------
+    - Fetches the due sources concurrently on ``fetch_pool``
+    - Appends a record only when the source sequence number has changed
+    - Adds local timestamp and machine name before buffering
+    - Resets a source's backoff after a successful fetch and doubles it, up to
+      ``BACKOFF_MAX``, after a failure
+    """
+    timestamp = datetime.now().isoformat()
+
+    futures = {
+        fetch_pool.submit(fetch_source, url): name
+        for name, url in SOURCES.items()
+        if now >= next_allowed.get(name, 0.0)
+    }
+    for future in as_completed(futures):
+        name = futures[future]
+        try:
+            parsed = future.result()
+            per_source_backoff[name] = BACKOFF_INITIAL
+            if parsed is None:
+                continue
+
+            seq = parsed.get("sequence")
+
+            if seq is not None and seq != last_sequence.get(name):
+                parsed["timestamp"] = timestamp
+                parsed["machine"] = name
+                buffer.append(parsed)
+                last_sequence[name] = seq
+                print(f"[{timestamp}] {name}: new seq {seq}")
+
+        except Exception as e:
+            delay = per_source_backoff.get(name, BACKOFF_INITIAL)
+            next_allowed[name] = now + delay
+            per_source_backoff[name] = min(delay * 2, BACKOFF_MAX)
+            print(f"[{timestamp}] {name} fetch error: {e} (retry in {delay:g}s)")
 
 
 def fetch_loop():
@@ -172,84 +363,240 @@ def fetch_loop():
 
     Behavior
     --------
-    - Polls each source every ``POLL_INTERVAL`` seconds
+    - Runs ``poll_sources`` every ``POLL_INTERVAL`` seconds
     - Parses XML responses into flat dictionaries
-    - Appends a record only when the source sequence number has changed
-    - Adds local timestamp and machine name before buffering
+    - Skips a failing source until its backoff delay has passed
 
     Notes
     -----
     This loop records the local polling time, not a source-provided event time.
     Duplicate suppression is based only on the most recent ``sequence`` value
-    seen per machine.
+    seen per machine. Responses are buffered from this thread as they
+    complete, so a tick takes about as long as the slowest source rather than
+    the sum of all of them.
     """
-    global buffer
-
     print("Fetching at 5Hz...")
     while not stop_event.is_set():
-        timestamp = datetime.now().isoformat()
+        tick_start = time.monotonic()
+        poll_sources(tick_start)
+        time.sleep(max(0.0, POLL_INTERVAL - (time.monotonic() - tick_start)))
 
-        for name, url in SOURCES.items():
-            try:
-                r = requests.get(url, timeout=1)
-                r.raise_for_status()
-                body = r.text.strip()
-                if not body:
-                    continue
-
-                parsed = extract_mtconnect_values(body, include_condition=False)
-                seq = parsed.get("sequence")
-
-                if seq is not None and seq != last_sequence.get(name):
-                    parsed["timestamp"] = timestamp
-                    parsed["machine"] = name
-                    buffer.append(parsed)
-                    last_sequence[name] = seq
-                    print(f"[{timestamp}] {name}: new seq {seq}")
 
-            except Exception as e:
-                print(f"[{timestamp}] {name} fetch error: {e}")
+def dump_line(entry):
+    """
+    Serialize one record as a UTF-8 JSONL line.
+
+    Parameters
+    ----------
+    entry : dict
+        Buffered telemetry record.
+
+    Returns
+    -------
+    bytes
+        JSON text followed by a newline.
+
+    Notes
+    -----
+    ``orjson`` is used when installed. It writes non-finite floats as
+    ``null`` where ``json.dumps`` writes ``NaN``/``Infinity``. Rows it cannot
+    encode, such as integers beyond 64 bits, fall back to ``json.dumps``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+
+def writer_path(day):
+    """
+    Return the absolute output path for one day under the current ``DATA_DIR``.
+
+    Parameters
+    ----------
+    day : str
+        Output day as ``YYYY-MM-DD``.
+
+    Returns
+    -------
+    str
+        Absolute path of ``data/YYYY-MM-DD.jsonl``.
+    """
+    return os.path.abspath(os.path.join(DATA_DIR, f"{day}.jsonl"))
+
+
+def get_writer(day):
+    """
+    Return the append handle for one day's output file, opening it if needed.
 
-        time.sleep(POLL_INTERVAL)
+    Parameters
+    ----------
+    day : str
+        Output day as ``YYYY-MM-DD``.
+
+    Returns
+    -------
+    io.FileIO
+        Unbuffered binary append handle for ``data/YYYY-MM-DD.jsonl``.
+
+    Notes
+    -----
+    Handles are unbuffered so a failed write never leaves bytes behind that a
+    later flush or close would still write out.
+    """
+    path = writer_path(day)
+    cached = open_files.get(path)
+    if cached is None:
+        directory = os.path.dirname(path)
+        if directory not in created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            created_dirs.add(directory)
+        cached = (day, open(path, "ab", buffering=0))
+        open_files[path] = cached
+    return cached[1]
+
+
+def close_writer(path):
+    """
+    Remove one handle from ``open_files`` and close it.
+
+    Parameters
+    ----------
+    path : str
+        Absolute output path the handle is cached under.
+
+    Notes
+    -----
+    Does nothing if no handle is cached for ``path``. Errors from ``close``
+    are printed rather than raised so a handle that already failed can always
+    be dropped.
+    """
+    cached = open_files.pop(path, None)
+    if cached is None:
+        return
+    try:
+        cached[1].close()
+    except OSError as e:
+        print(f"[{datetime.now()}] close error for {path}: {e}")
+
+
+def discard_writer(day):
+    """
+    Drop the cached handle for one day after a write error.
+
+    Parameters
+    ----------
+    day : str
+        Output day as ``YYYY-MM-DD``.
+
+    Notes
+    -----
+    The next :func:`get_writer` call for ``day`` opens a fresh handle.
+    """
+    close_writer(writer_path(day))
+
+
+def close_writers(before=None):
+    """
+    Close cached output handles.
+
+    Parameters
+    ----------
+    before : str | None, default=None
+        Only close handles for days earlier than this ``YYYY-MM-DD`` value.
+        If None, close all handles.
+
+    Notes
+    -----
+    Each handle is closed on its own, so one failing ``close`` does not leave
+    the remaining handles open.
+    """
+    for path, (day, _) in list(open_files.items()):
+        if before is not None and day >= before:
+            continue
+        close_writer(path)
 
 
 def flush_buffer_to_disk():
     """
-    Flush the current in-memory buffer to the daily JSONL output file.
+    Flush the current in-memory buffer to the daily JSONL output files.
 
     Behavior
     --------
     - Does nothing if the buffer is empty
-    - Writes all buffered rows to ``data/YYYY-MM-DD.jsonl``
-    - Clears the buffer after writing
+    - Pops the rows present at the start of the call off the buffer
+    - Groups rows by the day of their ``timestamp``
+    - Appends each group to ``data/YYYY-MM-DD.jsonl`` as one joined byte
+      string on an unbuffered handle cached in ``open_files``
+    - Closes handles for days before the local current date
 
     Notes
     -----
-    The output file is chosen using the local current date at flush time.
+    Rows without a timestamp are written to the local current date's file.
+    Handles are unbuffered, so written rows reach the OS at each flush
+    interval even though the files stay open, and a failed write leaves no
+    buffered copy of the rows behind to be written again next to the retry. If serializing or
+    writing a day's rows fails, that day's handle is discarded and the rows
+    of every day not yet written are returned to the front of the buffer
+    before the error is raised.
     """
-    global buffer
-
     if not buffer:
         return
 
-    os.makedirs(DATA_DIR, exist_ok=True)
-    filename = os.path.join(DATA_DIR, f"{datetime.now():%Y-%m-%d}.jsonl")
+    # Popping one row at a time never races with the fetch thread's appends,
+    # unlike swapping the buffer object, which could drop a row appended to
+    # the old buffer after the swap.
+    to_write = [buffer.popleft() for _ in range(len(buffer))]
 
-    with open(filename, "a") as f:
-        for entry in buffer:
-            f.write(json.dumps(entry) + "\n")
+    today = f"{datetime.now():%Y-%m-%d}"
+    days = [str(entry.get("timestamp") or "")[:10] or today for entry in to_write]
+    groups = defaultdict(list)
+    for day, entry in zip(days, to_write):
+        groups[day].append(entry)
 
-    print(f"[{datetime.now()}] Flushed {len(buffer)} entries.")
-    buffer = []
+    written_days = set()
+    day = None
+    try:
+        for day, entries in groups.items():
+            data = memoryview(b"".join(dump_line(entry) for entry in entries))
+            writer = get_writer(day)
+            while data:
+                data = data[writer.write(data):]
+            written_days.add(day)
+    except BaseException:
+        # The failing day's handle may be broken; drop it so the retry opens
+        # a fresh one.
+        if day is not None and day not in written_days:
+            discard_writer(day)
+        # Put rows whose day was not written back at the front of the buffer,
+        # in their original order, so the next flush retries them.
+        unwritten = [entry for day, entry in zip(days, to_write) if day not in written_days]
+        buffer.extendleft(reversed(unwritten))
+        raise
+
+    close_writers(before=today)
+
+    print(f"[{datetime.now()}] Flushed {len(to_write)} entries.")
 
 
 def flush_loop():
     """
     Periodically flush buffered records to disk until shutdown is requested.
+
+    A failed flush is reported and retried at the next interval instead of
+    ending the thread. Cached output files are closed when the loop exits.
     """
-    while not stop_event.is_set():
-        time.sleep(FLUSH_INTERVAL)
-        flush_buffer_to_disk()
+    try:
+        while not stop_event.is_set():
+            time.sleep(FLUSH_INTERVAL)
+            try:
+                flush_buffer_to_disk()
+            except Exception as e:
+                print(f"[{datetime.now()}] flush error: {e}")
+    finally:
+        close_writers()
 
 
 def run():
@@ -263,7 +610,7 @@ def run():
     On KeyboardInterrupt:
     - signals both threads to stop
     - waits for them to finish
-    - performs one final flush to disk
+    - performs one final flush to disk and closes the output files
     """
     fetch_thread = Thread(target=fetch_loop)
     flush_thread = Thread(target=flush_loop)
@@ -279,7 +626,9 @@ def run():
         stop_event.set()
         fetch_thread.join()
         flush_thread.join()
+        fetch_pool.shutdown()
         flush_buffer_to_disk()
+        close_writers()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import math
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+RECORDER_PATH = Path(__file__).resolve().parents[1] / "standalone_recorder.py"
+
+
+CURRENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<MTConnectStreams xmlns="urn:mtconnect.org:MTConnectStreams:1.3">
+  <Header creationTime="2026-07-28T07:35:00Z" instanceId="77" lastSequence="42" nextSequence="43"/>
+  <Streams>
+    <DeviceStream name="QuickTurn" uuid="QT-1">
+      <ComponentStream component="Rotary" componentId="c1" name="C">
+        <Samples>
+          <RotaryVelocity dataItemId="c1_rpm" name="S1" sequence="40">1200</RotaryVelocity>
+          <Load dataItemId="c1_load" name="l" sequence="41">3.5</Load>
+        </Samples>
+        <Events>
+          <Execution dataItemId="exec" name="execution" sequence="42">ACTIVE</Execution>
+        </Events>
+        <Condition>
+          <Normal dataItemId="c1_cond" name="spindle_cond" type="SYSTEM"/>
+        </Condition>
+      </ComponentStream>
+    </DeviceStream>
+  </Streams>
+</MTConnectStreams>
+"""
+
+
+def load_recorder(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    module_name = f"standalone_recorder_{tmp_path.name}"
+    spec = importlib.util.spec_from_file_location(module_name, RECORDER_PATH)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "DATA_DIR", str(tmp_path / "data"))
+    return module
+
+
+def test_extract_mtconnect_values_flattens_samples_and_events(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+
+    assert recorder.extract_mtconnect_values(CURRENT_XML.encode("utf-8")) == {
+        "sequence": 42,
+        "S1": 1200,
+        "l": 3.5,
+        "execution": "ACTIVE",
+    }
+    assert recorder.extract_mtconnect_values(CURRENT_XML, include_condition=True)["spindle_cond"] == "Normal"
+
+
+def test_extract_mtconnect_values_returns_nothing_for_truncated_xml(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    truncated = CURRENT_XML[: CURRENT_XML.index("<Execution") + len("<Execution dataItem")]
+
+    assert recorder.extract_mtconnect_values(truncated) == {}
+    assert recorder.extract_mtconnect_values(b"") == {}
+
+
+def test_fetch_source_follows_agent_redirects(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+
+    class AgentHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/old/current":
+                self.send_response(302)
+                self.send_header("Location", "/current")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = CURRENT_XML.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AgentHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        parsed = recorder.fetch_source(f"http://127.0.0.1:{server.server_address[1]}/old/current")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert parsed["sequence"] == 42
+    assert parsed["execution"] == "ACTIVE"
+
+
+def test_dump_line_falls_back_for_integers_beyond_64_bits(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    entry = {"timestamp": "2026-07-28T07:35:00", "part_count": 10**23}
+
+    assert recorder.dump_line(entry) == b'{"timestamp": "2026-07-28T07:35:00", "part_count": 100000000000000000000000}\n'
+
+
+def test_flush_groups_rows_by_their_timestamp_day(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    recorder.buffer.extend(
+        [
+            {"timestamp": "2026-07-27T23:59:59.900000", "machine": "VTC", "sequence": 1},
+            {"timestamp": "2026-07-28T00:00:00.100000", "machine": "VTC", "sequence": 2},
+            {"timestamp": "2026-07-28T00:00:00.200000", "machine": "IG500", "sequence": 7},
+        ]
+    )
+
+    recorder.flush_buffer_to_disk()
+    recorder.close_writers()
+
+    data_dir = tmp_path / "data"
+    assert sorted(path.name for path in data_dir.iterdir()) == ["2026-07-27.jsonl", "2026-07-28.jsonl"]
+    assert [json.loads(line)["sequence"] for line in (data_dir / "2026-07-28.jsonl").read_text().splitlines()] == [2, 7]
+    assert len(recorder.buffer) == 0
+
+
+def test_writer_cache_follows_data_dir_and_closes_past_days(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    first = recorder.get_writer("2026-07-27")
+    assert recorder.get_writer("2026-07-27") is first
+
+    monkeypatch.setattr(recorder, "DATA_DIR", str(tmp_path / "moved"))
+    moved = recorder.get_writer("2026-07-27")
+    today = recorder.get_writer("2026-07-28")
+    assert moved is not first
+    assert (tmp_path / "moved" / "2026-07-27.jsonl").exists()
+
+    recorder.close_writers(before="2026-07-28")
+    assert first.closed and moved.closed
+    assert not today.closed
+    assert list(recorder.open_files) == [str(tmp_path / "moved" / "2026-07-28.jsonl")]
+
+    recorder.close_writers()
+    assert today.closed
+    assert recorder.open_files == {}
+
+
+def test_discarded_writer_is_reopened_and_close_errors_do_not_leak_handles(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    broken = recorder.get_writer("2026-07-27")
+    recorder.discard_writer("2026-07-27")
+    assert broken.closed
+    assert recorder.get_writer("2026-07-27") is not broken
+
+    class FailingClose:
+        closed = False
+
+        def close(self):
+            raise OSError("stale handle")
+
+    failing_path = recorder.writer_path("2026-07-26")
+    recorder.open_files[failing_path] = ("2026-07-26", FailingClose())
+    healthy = recorder.get_writer("2026-07-28")
+
+    recorder.close_writers()
+
+    assert healthy.closed
+    assert recorder.open_files == {}
+
+
+def test_flush_drains_the_buffer_and_requeues_rows_after_a_write_error(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    rows = [
+        {"timestamp": "2026-07-27T23:59:59", "machine": "VTC", "sequence": 1},
+        {"timestamp": "2026-07-28T00:00:01", "machine": "VTC", "sequence": 2},
+        {"timestamp": "2026-07-28T00:00:02", "machine": "VTC", "sequence": 3},
+    ]
+    recorder.buffer.extend(rows)
+    real_get_writer = recorder.get_writer
+
+    def failing_get_writer(day):
+        if day == "2026-07-28":
+            raise OSError("disk full")
+        return real_get_writer(day)
+
+    monkeypatch.setattr(recorder, "get_writer", failing_get_writer)
+    recorder.buffer.append({"timestamp": "2026-07-28T00:00:03", "machine": "VTC", "sequence": 4})
+    with pytest.raises(OSError, match="disk full"):
+        recorder.flush_buffer_to_disk()
+
+    assert [row["sequence"] for row in recorder.buffer] == [2, 3, 4]
+
+    monkeypatch.setattr(recorder, "get_writer", real_get_writer)
+    recorder.buffer.append({"timestamp": "2026-07-28T00:00:04", "machine": "VTC", "sequence": 5})
+    recorder.flush_buffer_to_disk()
+    recorder.close_writers()
+
+    assert len(recorder.buffer) == 0
+    data_dir = tmp_path / "data"
+    assert [json.loads(line)["sequence"] for line in (data_dir / "2026-07-27.jsonl").read_text().splitlines()] == [1]
+    assert [json.loads(line)["sequence"] for line in (data_dir / "2026-07-28.jsonl").read_text().splitlines()] == [2, 3, 4, 5]
+
+
+def test_flush_retry_writes_each_row_once_after_a_failed_write(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    real_get_writer = recorder.get_writer
+
+    class FailingWriter:
+        def write(self, data):
+            raise OSError("write failed")
+
+    failed = []
+
+    def failing_get_writer(day):
+        # Open (and cache) the real handle, but fail the write itself.
+        failed.append(real_get_writer(day))
+        return FailingWriter()
+
+    monkeypatch.setattr(recorder, "get_writer", failing_get_writer)
+    recorder.buffer.extend({"timestamp": "2026-07-28T00:00:01", "machine": "VTC", "sequence": seq} for seq in (1, 2))
+    with pytest.raises(OSError, match="write failed"):
+        recorder.flush_buffer_to_disk()
+    assert failed[0].closed
+    assert recorder.open_files == {}
+
+    monkeypatch.setattr(recorder, "get_writer", real_get_writer)
+    recorder.flush_buffer_to_disk()
+    recorder.close_writers()
+
+    lines = (tmp_path / "data" / "2026-07-28.jsonl").read_text().splitlines()
+    assert [json.loads(line)["sequence"] for line in lines] == [1, 2]
+
+
+def test_failing_source_backs_off_without_blocking_other_sources(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    monkeypatch.setattr(recorder, "SOURCES", {"VTC": "http://vtc/current", "IG500": "http://ig500/current"})
+    vtc_up = False
+    calls: list[str] = []
+    sequences = {"VTC": 0, "IG500": 0}
+
+    def fake_fetch_source(url):
+        name = "VTC" if "vtc" in url else "IG500"
+        calls.append(name)
+        if name == "VTC" and not vtc_up:
+            raise ConnectionError("timed out")
+        sequences[name] += 1
+        return {"sequence": sequences[name]}
+
+    monkeypatch.setattr(recorder, "fetch_source", fake_fetch_source)
+
+    recorder.poll_sources(100.0)
+    assert recorder.next_allowed["VTC"] == 101.0
+    assert recorder.per_source_backoff["VTC"] == 2.0
+
+    calls.clear()
+    recorder.poll_sources(100.5)
+    assert calls == ["IG500"]
+
+    recorder.poll_sources(101.0)
+    assert recorder.next_allowed["VTC"] == 103.0
+    assert recorder.per_source_backoff["VTC"] == 4.0
+
+    vtc_up = True
+    recorder.poll_sources(103.0)
+    assert recorder.per_source_backoff["VTC"] == recorder.BACKOFF_INITIAL
+    assert [(row["machine"], row["sequence"]) for row in recorder.buffer if row["machine"] == "VTC"] == [("VTC", 1)]
+    assert len([row for row in recorder.buffer if row["machine"] == "IG500"]) == 4
+
+
+def test_backoff_is_capped(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+    monkeypatch.setattr(recorder, "SOURCES", {"VTC": "http://vtc/current"})
+
+    def failing_fetch_source(url):
+        raise ConnectionError("refused")
+
+    monkeypatch.setattr(recorder, "fetch_source", failing_fetch_source)
+    now = 0.0
+    for _ in range(10):
+        now = recorder.next_allowed.get("VTC", now)
+        recorder.poll_sources(now)
+
+    assert recorder.per_source_backoff["VTC"] == recorder.BACKOFF_MAX
+    assert recorder.next_allowed["VTC"] - now == recorder.BACKOFF_MAX
+
+
+def test_try_number_matches_int_then_float_conversion(tmp_path, monkeypatch):
+    recorder = load_recorder(tmp_path, monkeypatch)
+
+    def reference(value):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return value
+
+    cases = [
+        "", " ", "5", " 5 ", "-3", "+2.5", ".5", "1e3", "1_000", "nan", "-inf", "Infinity",
+        "ACTIVE", "UNAVAILABLE", "٣", "x1", "1x", "\t7\n", "0x10", "i", "n",
+    ]
+    for value in cases:
+        expected = reference(value)
+        result = recorder.try_number(value)
+        assert type(result) is type(expected), value
+        if isinstance(expected, float) and math.isnan(expected):
+            assert math.isnan(result), value
+        else:
+            assert result == expected, value